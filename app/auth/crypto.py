@@ -0,0 +1,124 @@
+"""
+Credential Encryption at Rest
+
+Encrypts credential files with AES-256-GCM when a master key is configured.
+Set SCHEDULER_MASTER_KEY to a base64-encoded 32-byte key to turn it on, e.g.
+the output of: python -c "import os, base64; print(base64.b64encode(os.urandom(32)).decode())"
+
+Encrypted blobs are laid out as version byte + 12-byte nonce + ciphertext, so
+the format can change (or keys rotate) without breaking existing files. Files
+written without a key stay plain JSON and are still read transparently.
+"""
+
+import base64
+import json
+import os
+
+import orjson
+
+MASTER_KEY_ENV = "SCHEDULER_MASTER_KEY"
+
+# Leading byte of an encrypted blob; never the first byte of a JSON document
+FORMAT_VERSION = b"\x01"
+
+NONCE_SIZE = 12
+
+
+def _master_key() -> bytes:
+    """Decode the master key from the environment, or None if it is not set."""
+    encoded = os.environ.get(MASTER_KEY_ENV)
+    if not encoded:
+        return None
+    key = base64.b64decode(encoded)
+    if len(key) != 32:
+        raise ValueError(f"{MASTER_KEY_ENV} must be a base64-encoded 32-byte key")
+    return key
+
+
+def encryption_enabled() -> bool:
+    """Whether credentials are encrypted when they are written."""
+    return bool(os.environ.get(MASTER_KEY_ENV))
+
+
+def encrypt_blob(data: bytes) -> bytes:
+    """
+    Encrypt data with AES-256-GCM under the master key.
+
+    Args:
+        data (bytes): Plaintext to encrypt
+
+    Returns:
+        bytes: Version byte, nonce and ciphertext with its authentication tag
+
+    Raises:
+        ValueError: If no master key is configured
+    """
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    key = _master_key()
+    if key is None:
+        raise ValueError(f"{MASTER_KEY_ENV} is not set")
+
+    nonce = os.urandom(NONCE_SIZE)
+    return FORMAT_VERSION + nonce + AESGCM(key).encrypt(nonce, data, FORMAT_VERSION)
+
+
+def decrypt_blob(blob: bytes) -> bytes:
+    """
+    Decrypt a blob produced by encrypt_blob.
+
+    Args:
+        blob (bytes): Encrypted blob
+
+    Returns:
+        bytes: Decrypted plaintext
+
+    Raises:
+        ValueError: If no key is configured, the version is unknown, or the
+            blob fails authentication
+    """
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    if blob[:1] != FORMAT_VERSION:
+        raise ValueError("Unsupported credential encryption version")
+
+    key = _master_key()
+    if key is None:
+        raise ValueError(f"Credentials are encrypted but {MASTER_KEY_ENV} is not set")
+
+    nonce = blob[1:1 + NONCE_SIZE]
+    try:
+        return AESGCM(key).decrypt(nonce, blob[1 + NONCE_SIZE:], FORMAT_VERSION)
+    except InvalidTag:
+        raise ValueError("Credentials could not be decrypted with the configured key")
+
+
+def dump_credentials(credentials: dict, **json_kwargs) -> bytes:
+    """
+    Serialise credentials for writing to disk, encrypting them if a key is set.
+
+    Args:
+        credentials (dict): Credentials to serialise
+        **json_kwargs: Extra arguments for json.dumps, e.g. indent or default
+
+    Returns:
+        bytes: File contents to write in binary mode
+    """
+    data = json.dumps(credentials, **json_kwargs).encode("utf-8")
+    return encrypt_blob(data) if encryption_enabled() else data
+
+
+def load_credentials(raw: bytes):
+    """
+    Parse credential file contents, decrypting them first if they are encrypted.
+
+    Args:
+        raw (bytes): Raw file contents
+
+    Returns:
+        The parsed JSON value
+    """
+    if raw[:1] == FORMAT_VERSION:
+        raw = decrypt_blob(raw)
+    return orjson.loads(raw)
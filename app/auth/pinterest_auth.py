@@ -28,6 +28,7 @@ from app.config import (
     PINTEREST_CLIENT_ID, PINTEREST_CLIENT_SECRET, PINTEREST_REDIRECT_URI,
     USE_DATABASE
 )
+from app.http.session import get_session
 
 # Pinterest API v5 endpoints
 PINTEREST_AUTH_URL = "https://www.pinterest.com/oauth/"
@@ -93,7 +94,7 @@ def exchange_code_for_tokens(auth_code: str) -> Dict:
     }
     
     try:
-        response = requests.post(PINTEREST_TOKEN_URL, headers=headers, data=data)
+        response = get_session().post(PINTEREST_TOKEN_URL, headers=headers, data=data)
         response.raise_for_status()
         
         token_data = response.json()
@@ -132,7 +133,7 @@ def refresh_access_token(refresh_token: str) -> Dict:
     }
     
     try:
-        response = requests.post(PINTEREST_TOKEN_URL, headers=headers, data=data)
+        response = get_session().post(PINTEREST_TOKEN_URL, headers=headers, data=data)
         response.raise_for_status()
         
         token_data = response.json()
@@ -166,7 +167,7 @@ def get_user_info(access_token: str) -> Dict:
     }
     
     try:
-        response = requests.get(f"{PINTEREST_API_BASE}/user_account", headers=headers)
+        response = get_session().get(f"{PINTEREST_API_BASE}/user_account", headers=headers)
         response.raise_for_status()
         
         user_data = response.json()
@@ -177,12 +178,16 @@ def get_user_info(access_token: str) -> Dict:
     except Exception as e:
         raise Exception(f"User info error: {str(e)}")
 
-def get_user_boards(access_token: str) -> Dict:
+def get_user_boards(access_token: str, page_size: int = 25) -> Dict:
     """
-    Get user's Pinterest boards.
+    Get the first page of the user's Pinterest boards.
+    
+    Only one page is requested; later pages (the response's "bookmark")
+    are not followed.
     
     Args:
         access_token (str): Valid Pinterest access token
+        page_size (int): Maximum number of boards to return (Pinterest allows 1-250)
         
     Returns:
         Dict: User's boards information
@@ -196,7 +201,11 @@ def get_user_boards(access_token: str) -> Dict:
     }
     
     try:
-        response = requests.get(f"{PINTEREST_API_BASE}/boards", headers=headers)
+        response = get_session().get(
+            f"{PINTEREST_API_BASE}/boards",
+            headers=headers,
+            params={"page_size": page_size}
+        )
         response.raise_for_status()
         
         boards_data = response.json()
@@ -318,7 +327,7 @@ def load_pinterest_credentials() -> Optional[Dict]:
                 LIMIT 1
                 """
                 
-                result = execute_query(query)
+                result = execute_query(query, fetch=True)
                 
                 if result:
                     import json
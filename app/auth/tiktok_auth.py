@@ -1,8 +1,8 @@
 import os
-import requests
 from requests_oauthlib import OAuth2Session
 from dotenv import load_dotenv
 from urllib.parse import urlencode
+from app.http.session import get_session
 
 # Test environment only
 # Remove this in production
@@ -19,6 +19,7 @@ REDIRECT_URI = os.getenv("TIKTOK_REDIRECT_URI")
 
 AUTH_BASE_URL = "https://www.tiktok.com/auth/authorize/"
 TOKEN_URL = "https://open-api.tiktok.com/oauth/access_token/"
+REFRESH_TOKEN_URL = "https://open-api.tiktok.com/oauth/refresh_token/"
 SCOPES = ['user.info.basic', 'user.info.profile', 'video.list', 'video.upload', 'video.publish']
 
 def get_tiktok_login_url():
@@ -73,7 +74,7 @@ def fetch_tiktok_token(redirect_response_url):
         'Content-Type': 'application/x-www-form-urlencoded'
     }
     
-    response = requests.post(TOKEN_URL, data=token_data, headers=headers)
+    response = get_session().post(TOKEN_URL, data=token_data, headers=headers)
     response.raise_for_status()
     
     result = response.json()
@@ -81,4 +82,34 @@ def fetch_tiktok_token(redirect_response_url):
     if 'data' not in result:
         raise ValueError(f"TikTok API error: {result}")
     
-    return result['data'] 
\ No newline at end of file
+    return result['data'] 
+
+def refresh_tiktok_token(refresh_token):
+    """
+    Exchange a refresh token for a new access token.
+    
+    Args:
+        refresh_token (str): Refresh token from a previous token response
+        
+    Returns:
+        dict: Token response from TikTok API
+    """
+    token_data = {
+        'client_key': CLIENT_ID,
+        'grant_type': 'refresh_token',
+        'refresh_token': refresh_token
+    }
+    
+    headers = {
+        'Content-Type': 'application/x-www-form-urlencoded'
+    }
+    
+    response = get_session().post(REFRESH_TOKEN_URL, data=token_data, headers=headers)
+    response.raise_for_status()
+    
+    result = response.json()
+    
+    if 'data' not in result or 'access_token' not in result['data']:
+        raise ValueError(f"TikTok API error: {result}")
+    
+    return result['data']
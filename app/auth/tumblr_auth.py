@@ -6,12 +6,14 @@ Unlike Facebook and Instagram which use OAuth 2.0, Tumblr uses OAuth 1.0a.
 """
 
 import os
-import json
 import requests
 import logging
 from urllib.parse import urlencode, parse_qs
 from requests_oauthlib import OAuth1Session
 from app.config import USE_DATABASE
+from app.platforms._cred_cache import cached_load
+from app.auth.crypto import dump_credentials
+from app.http.session import share_pool
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -40,7 +42,7 @@ def generate_tumblr_auth_url():
             return None
         
         # Step 1: Get request token
-        oauth = OAuth1Session(client_key, client_secret=client_secret, callback_uri=callback_uri)
+        oauth = share_pool(OAuth1Session(client_key, client_secret=client_secret, callback_uri=callback_uri))
         
         response = oauth.fetch_request_token(TUMBLR_REQUEST_TOKEN_URL)
         
@@ -83,13 +85,13 @@ def exchange_code_for_tokens(oauth_token, oauth_token_secret, oauth_verifier):
             }
         
         # Create OAuth session with request token
-        oauth = OAuth1Session(
+        oauth = share_pool(OAuth1Session(
             client_key,
             client_secret=client_secret,
             resource_owner_key=oauth_token,
             resource_owner_secret=oauth_token_secret,
             verifier=oauth_verifier
-        )
+        ))
         
         # Exchange for access token
         oauth_tokens = oauth.fetch_access_token(TUMBLR_ACCESS_TOKEN_URL)
@@ -122,12 +124,12 @@ def get_user_info(access_token, access_token_secret):
         client_key = os.getenv('TUMBLR_CLIENT_ID')
         client_secret = os.getenv('TUMBLR_CLIENT_SECRET')
         
-        oauth = OAuth1Session(
+        oauth = share_pool(OAuth1Session(
             client_key,
             client_secret=client_secret,
             resource_owner_key=access_token,
             resource_owner_secret=access_token_secret
-        )
+        ))
         
         response = oauth.get(f"{TUMBLR_API_BASE_URL}/user/info")
         
@@ -221,8 +223,8 @@ def save_tumblr_credentials(credentials, user_id=None):
             
             file_path = f"{credentials_dir}/tumblr_credentials.json"
             
-            with open(file_path, 'w') as f:
-                json.dump(credentials, f, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(dump_credentials(credentials, indent=2))
             
             logger.info("Tumblr credentials saved to file")
             return True
@@ -280,15 +282,13 @@ def load_tumblr_credentials(user_id=None):
             # Fallback to file if database failed or had no credentials
             file_path = "data/credentials/tumblr_credentials.json"
             
-            if os.path.exists(file_path):
-                try:
-                    with open(file_path, 'r') as f:
-                        credentials = json.load(f)
-                        if credentials:
-                            logger.info("✅ Tumblr credentials loaded from file (fallback)")
-                            return credentials
-                except Exception as e:
-                    logger.error(f"Error reading Tumblr file: {e}")
+            try:
+                credentials = cached_load(file_path)
+                if credentials:
+                    logger.info("✅ Tumblr credentials loaded from file (fallback)")
+                    return credentials
+            except Exception as e:
+                logger.error(f"Error reading Tumblr file: {e}")
             
             logger.info("❌ No Tumblr credentials found in database or file")
             return None
@@ -297,12 +297,10 @@ def load_tumblr_credentials(user_id=None):
             # Database disabled - only try file
             file_path = "data/credentials/tumblr_credentials.json"
             
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    credentials = json.load(f)
-                    if credentials:
-                        logger.info("✅ Tumblr credentials loaded from file")
-                        return credentials
+            credentials = cached_load(file_path)
+            if credentials:
+                logger.info("✅ Tumblr credentials loaded from file")
+                return credentials
             
             logger.info("❌ No Tumblr credentials found in file")
             return None
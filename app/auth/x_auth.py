@@ -15,10 +15,10 @@ Functions:
 """
 
 import os
-import json
 import base64
 import hashlib
 import secrets
+import time
 import requests
 from urllib.parse import urlencode, parse_qs
 from app.config import (
@@ -26,6 +26,9 @@ from app.config import (
     X_ACCESS_TOKEN, X_REFRESH_TOKEN, USE_DATABASE
 )
 from app.db.database import execute_query
+from app.platforms._cred_cache import cached_load
+from app.auth.crypto import dump_credentials
+from app.http.session import get_session
 
 
 def generate_code_verifier_and_challenge():
@@ -125,7 +128,7 @@ def exchange_code_for_tokens(authorization_code, code_verifier, state=None):
     }
     
     try:
-        response = requests.post(token_url, data=token_data, headers=headers)
+        response = get_session().post(token_url, data=token_data, headers=headers)
         response.raise_for_status()
         
         token_info = response.json()
@@ -172,7 +175,7 @@ def refresh_access_token(refresh_token):
     }
     
     try:
-        response = requests.post(token_url, data=refresh_data, headers=headers)
+        response = get_session().post(token_url, data=refresh_data, headers=headers)
         response.raise_for_status()
         
         return response.json()
@@ -199,7 +202,7 @@ def get_user_info(access_token):
     }
     
     try:
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers)
         response.raise_for_status()
         
         user_data = response.json()
@@ -271,8 +274,8 @@ def save_x_credentials(credentials):
         
         credentials_file = os.path.join(secure_dir, "x_token.json")
         
-        with open(credentials_file, 'w') as f:
-            json.dump(credentials, f, indent=2, default=str)
+        with open(credentials_file, 'wb') as f:
+            f.write(dump_credentials(credentials, indent=2, default=str))
 
 
 def load_x_credentials():
@@ -315,15 +318,13 @@ def load_x_credentials():
         secure_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "secure")
         credentials_file = os.path.join(secure_dir, "x_token.json")
         
-        if os.path.exists(credentials_file):
-            try:
-                with open(credentials_file, 'r') as f:
-                    credentials = json.load(f)
-                    if credentials:
-                        print("✅ X credentials loaded from file (fallback)")
-                        return credentials
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error reading X file: {e}")
+        try:
+            credentials = cached_load(credentials_file)
+            if credentials:
+                print("✅ X credentials loaded from file (fallback)")
+                return credentials
+        except (ValueError, IOError) as e:
+            print(f"Error reading X file: {e}")
         
         print("❌ No X credentials found in database or file")
         return None
@@ -333,15 +334,13 @@ def load_x_credentials():
         secure_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "secure")
         credentials_file = os.path.join(secure_dir, "x_token.json")
         
-        if os.path.exists(credentials_file):
-            try:
-                with open(credentials_file, 'r') as f:
-                    credentials = json.load(f)
-                    if credentials:
-                        print("✅ X credentials loaded from file")
-                        return credentials
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error reading X file: {e}")
+        try:
+            credentials = cached_load(credentials_file)
+            if credentials:
+                print("✅ X credentials loaded from file")
+                return credentials
+        except (ValueError, IOError) as e:
+            print(f"Error reading X file: {e}")
         
         print("❌ No X credentials found in file")
         return None
@@ -377,6 +376,7 @@ def get_valid_access_token():
             
             # Update stored credentials
             credentials.update(new_tokens)
+            credentials['obtained_at'] = time.time()
             save_x_credentials(credentials)
             
             return new_tokens.get('access_token')
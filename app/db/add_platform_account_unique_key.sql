@@ -0,0 +1,27 @@
+-- Adds the (platform, page_id) unique key to a platform_accounts table created
+-- before it was part of mysql_create_tables.sql. Account saves rely on this key
+-- for ON DUPLICATE KEY UPDATE; without it every setup run inserts a new row.
+--
+-- Run once:
+--   mysql -u username -p database_name < app/db/add_platform_account_unique_key.sql
+
+-- Point posts at the newest row of each duplicated account
+UPDATE posts p
+JOIN platform_accounts older ON p.account_id = older.id
+JOIN (
+    SELECT platform, page_id, MAX(id) AS keep_id
+    FROM platform_accounts
+    GROUP BY platform, page_id
+) newest ON newest.platform = older.platform AND newest.page_id = older.page_id
+SET p.account_id = newest.keep_id
+WHERE older.id <> newest.keep_id;
+
+-- Drop the older duplicates, keeping the most recently saved token
+DELETE older FROM platform_accounts older
+JOIN platform_accounts newer
+    ON newer.platform = older.platform
+    AND newer.page_id = older.page_id
+    AND newer.id > older.id;
+
+ALTER TABLE platform_accounts
+    ADD UNIQUE KEY unique_platform_account (platform, page_id);
@@ -1,4 +1,6 @@
 import os
+import json
+from contextlib import contextmanager
 import mysql.connector
 from dotenv import load_dotenv
 
@@ -19,32 +21,78 @@ def get_connection():
         database=os.getenv("DB_NAME")
     )
 
-def execute_query(query, params=None, fetch=False, dictionary=False):
+@contextmanager
+def transaction(dictionary=False):
+    """
+    Run several statements on one connection and commit them together.
+    
+    Usage:
+        with transaction() as cursor:
+            cursor.execute(...)
+            cursor.execute(...)
+    
+    Args:
+        dictionary (bool): Whether the cursor returns rows as dictionaries
+        
+    Yields:
+        cursor: Cursor inside an open transaction, committed on exit and
+            rolled back if the block raises
+    """
+    conn = get_connection()
+    cursor = conn.cursor(dictionary=True) if dictionary else conn.cursor()
+    
+    try:
+        conn.start_transaction()
+        yield cursor
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+def execute_query(query, params=None, fetch=False, dictionary=False, many=False, explicit_tx=False):
     """
     Execute a SQL query with optional parameters.
     
     Args:
         query (str): SQL query to execute
-        params (tuple, optional): Parameters for the query
+        params (tuple or list, optional): Parameters for the query, or a list of
+            parameter tuples when many=True
         fetch (bool): Whether to fetch and return results
         dictionary (bool): Whether to return results as dictionaries
+        many (bool): Whether to run the query for every tuple in params with executemany
+        explicit_tx (bool): Whether to run in an explicit transaction that is rolled back on error
         
     Returns:
-        list or None: Query results if fetch=True, None otherwise
+        list or int: Query results if fetch=True, otherwise the affected row count
     """
     conn = get_connection()
-    cursor_class = conn.cursor(dictionary=True) if dictionary else conn.cursor()
-    cursor = cursor_class
+    cursor = conn.cursor(dictionary=True) if dictionary else conn.cursor()
 
-    cursor.execute(query, params or ())
+    try:
+        if explicit_tx:
+            conn.start_transaction()
 
-    result = None
-    if fetch:
-        result = cursor.fetchall()
+        if many:
+            cursor.executemany(query, params or [])
+        else:
+            cursor.execute(query, params or ())
 
-    conn.commit()
-    cursor.close()
-    conn.close()
+        if fetch:
+            result = cursor.fetchall()
+        else:
+            result = cursor.rowcount
+
+        conn.commit()
+    except Exception:
+        if explicit_tx:
+            conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
 
     return result
 
@@ -70,6 +118,47 @@ def insert_post(platform, content, media_path, scheduled_time, status="scheduled
     cursor.close()
     conn.close()
 
+def insert_posts_batch(rows):
+    """
+    Insert several posts into the posts table in a single transaction.
+    
+    Args:
+        rows (list): Tuples of (platform, content, media_path, scheduled_time, status)
+        
+    Returns:
+        int: Number of rows inserted
+    """
+    if not rows:
+        return 0
+    sql = '''
+        INSERT INTO posts (platform, content, media_path, scheduled_time, status)
+        VALUES (%s, %s, %s, %s, %s)
+    '''
+    with transaction() as cursor:
+        cursor.executemany(sql, rows)
+        return cursor.rowcount
+
+def insert_draft(content, platforms, media_path=None, saved_at=None):
+    """
+    Insert a single draft covering all of its target platforms.
+    
+    Args:
+        content (str): Draft content text
+        platforms (list): Platform names the draft is intended for
+        media_path (str): Path to media file (if any)
+        saved_at (datetime): When the draft was saved (default: now, set by the database)
+    """
+    conn = get_connection()
+    cursor = conn.cursor()
+    sql = '''
+        INSERT INTO drafts (content, platforms, media_path, saved_at)
+        VALUES (%s, %s, %s, COALESCE(%s, NOW()))
+    '''
+    cursor.execute(sql, (content, json.dumps(platforms), media_path, saved_at))
+    conn.commit()
+    cursor.close()
+    conn.close()
+
 def get_due_posts(current_time):
     """
     Get all posts that are due for publishing.
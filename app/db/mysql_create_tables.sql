@@ -5,7 +5,8 @@ CREATE TABLE IF NOT EXISTS platform_accounts (
     page_id VARCHAR(100) NOT NULL,
     access_token TEXT NOT NULL,
     display_name VARCHAR(100),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY unique_platform_account (platform, page_id)
 );
 
 CREATE TABLE IF NOT EXISTS posts (
@@ -18,3 +19,11 @@ CREATE TABLE IF NOT EXISTS posts (
     account_id INT,
     FOREIGN KEY (account_id) REFERENCES platform_accounts(id)
 );
+
+CREATE TABLE IF NOT EXISTS drafts (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    content TEXT NOT NULL,
+    platforms JSON NOT NULL,
+    media_path VARCHAR(255),
+    saved_at DATETIME NOT NULL
+);
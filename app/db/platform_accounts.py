@@ -0,0 +1,35 @@
+"""
+Platform account storage shared by the setup scripts.
+
+Accounts are keyed by the unique (platform, page_id) key on platform_accounts,
+so saving an account that already exists updates its token and name in place.
+"""
+
+from app.db.database import execute_query
+
+UPSERT_ACCOUNT_SQL = """
+    INSERT INTO platform_accounts (platform, page_id, access_token, display_name)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE access_token = VALUES(access_token), display_name = VALUES(display_name)
+"""
+
+
+def upsert_many(platform, rows):
+    """
+    Insert or update several accounts for one platform in a single transaction.
+
+    The connector sends executemany INSERTs as one multi-row statement, so
+    this is a single round-trip however many accounts are saved.
+
+    Args:
+        platform (str): Platform name (e.g., 'facebook')
+        rows (list): (page_id, access_token, display_name) tuples
+
+    Returns:
+        int: Number of rows affected, as reported by MySQL
+    """
+    if not rows:
+        return 0
+
+    params = [(platform, page_id, access_token, display_name) for page_id, access_token, display_name in rows]
+    return execute_query(UPSERT_ACCOUNT_SQL, params, many=True, explicit_tx=True)
@@ -0,0 +1,60 @@
+"""
+Shared HTTP Session for Social Media Scheduler
+
+A single process-wide requests.Session used for every platform and auth API
+call, so HTTPS connections are kept alive and reused instead of paying a new
+TCP and TLS handshake per request.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_session = None
+_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session, creating it on first use.
+
+    Transient failures (429 and 5xx) are retried with backoff for idempotent
+    methods only, so a POST that publishes content is never sent twice.
+
+    Returns:
+        requests.Session: Session with a pooled, retrying HTTPS adapter
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                retries = Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    raise_on_status=False
+                )
+                session = requests.Session()
+                # Sized to cover the dashboard's worker pool posting in parallel
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retries))
+                _session = session
+    return _session
+
+
+def share_pool(session: requests.Session) -> requests.Session:
+    """
+    Mount the shared HTTPS adapter on another session.
+
+    For sessions that must be their own class, such as OAuth1Session for
+    request signing, so they still draw from the process-wide connection pool.
+
+    Args:
+        session (requests.Session): Session to attach the pooled adapter to
+
+    Returns:
+        requests.Session: The same session, for chaining
+    """
+    session.mount("https://", get_session().get_adapter("https://"))
+    return session
@@ -0,0 +1,66 @@
+"""
+Credential File Cache
+
+Caches parsed credential JSON files keyed by path and modification time, so
+repeated credential loads only touch disk when a setup script has rewritten
+the token file. Missing files are cached briefly so a freshly written token
+is still picked up within a few seconds. Callers get their own copy of the
+parsed value, so updating it (e.g. after a token refresh) never changes what
+other threads see.
+"""
+
+import copy
+import os
+import time
+
+from app.auth.crypto import load_credentials
+
+# Seconds to remember that a credential file does not exist
+NEGATIVE_TTL = 5.0
+
+# path -> ((st_mtime_ns, st_size), parsed value) or (None, negative expiry)
+_CACHE = {}
+
+
+def _read_json(path: str):
+    """Parse a JSON credential file, decrypting it first if it was encrypted."""
+    with open(path, 'rb') as f:
+        return load_credentials(f.read())
+
+
+def cached_load(path: str, loader=_read_json):
+    """
+    Load a credential file, reusing the parsed result until the file changes.
+    
+    Args:
+        path (str): Path to the credential file
+        loader (callable): Function that parses the file at path
+        
+    Returns:
+        A copy of the loader's result, or None if the file does not exist
+    """
+    hit = _CACHE.get(path)
+    if hit is not None and hit[0] is None and time.monotonic() < hit[1]:
+        return None
+    
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        _CACHE[path] = (None, time.monotonic() + NEGATIVE_TTL)
+        return None
+    
+    key = (stat.st_mtime_ns, stat.st_size)
+    if hit is not None and hit[0] == key:
+        return copy.deepcopy(hit[1])
+    
+    value = loader(path)
+    _CACHE[path] = (key, value)
+    return copy.deepcopy(value)
+
+
+def invalidate(path: str = None):
+    """Drop the cached entry for path, or every entry if path is omitted."""
+    if path is None:
+        _CACHE.clear()
+    else:
+        _CACHE.pop(path, None)
@@ -1,10 +1,16 @@
 import requests
 import json
-import os
+from itertools import islice
+from urllib.parse import urlencode
 from typing import Optional, Dict, Any
+from app.platforms._cred_cache import cached_load
+from app.http.session import get_session
 
 GRAPH_API_BASE = "https://graph.facebook.com/v19.0"
 
+# Maximum number of sub-requests the Graph API accepts in one batch call
+GRAPH_BATCH_LIMIT = 50
+
 def get_user_pages(user_access_token):
     """
     Retrieves all Facebook pages associated with the user's access token.
@@ -21,7 +27,7 @@ def get_user_pages(user_access_token):
     params = {
         "access_token": user_access_token
     }
-    response = requests.get(url, params=params)
+    response = get_session().get(url, params=params)
     print("Direct accounts response:", response.text)
     
     if response.status_code == 200:
@@ -34,35 +40,35 @@ def get_user_pages(user_access_token):
     try:
         # Get user's businesses
         business_url = f"https://graph.facebook.com/v19.0/me/businesses"
-        business_response = requests.get(business_url, params=params)
+        business_response = get_session().get(business_url, params=params)
         print("Business response:", business_response.text)
         
         if business_response.status_code == 200:
             business_data = business_response.json()
             all_pages = {"data": []}
+            client_pages = []
             
             # For each business, get its pages
             for business in business_data.get('data', []):
                 business_id = business['id']
                 pages_url = f"https://graph.facebook.com/v19.0/{business_id}/client_pages"
-                pages_response = requests.get(pages_url, params=params)
+                pages_response = get_session().get(pages_url, params=params)
                 print(f"Pages for business {business_id}:", pages_response.text)
                 
                 if pages_response.status_code == 200:
-                    pages_data = pages_response.json()
-                    # Add pages with access tokens
-                    for page in pages_data.get('data', []):
-                        # Get page access token
-                        page_token_url = f"https://graph.facebook.com/v19.0/{page['id']}"
-                        page_token_params = {
-                            "fields": "access_token,name",
-                            "access_token": user_access_token
-                        }
-                        token_response = requests.get(page_token_url, params=page_token_params)
-                        if token_response.status_code == 200:
-                            token_data = token_response.json()
-                            page.update(token_data)
-                            all_pages["data"].append(page)
+                    client_pages.extend(pages_response.json().get('data', []))
+            
+            # Get every page's access token in batched requests
+            if client_pages:
+                page_tokens = {
+                    page['id']: page
+                    for page in fetch_pages_batch(user_access_token, [page['id'] for page in client_pages])
+                }
+                for page in client_pages:
+                    token_data = page_tokens.get(page['id'])
+                    if token_data:
+                        page.update(token_data)
+                        all_pages["data"].append(page)
             
             if all_pages["data"]:
                 return all_pages
@@ -74,6 +80,113 @@ def get_user_pages(user_access_token):
     response.raise_for_status()
     return response.json()
 
+def fetch_pages_batch(user_access_token, page_ids):
+    """
+    Retrieves name, access token and category for many pages using Graph API
+    batch requests, sending up to GRAPH_BATCH_LIMIT lookups per call.
+    
+    Args:
+        user_access_token (str): User's Facebook access token
+        page_ids (list): Facebook page IDs to look up
+        
+    Returns:
+        list: Page data for every lookup that succeeded
+    """
+    pages = []
+    remaining = iter(page_ids)
+    
+    while True:
+        chunk = list(islice(remaining, GRAPH_BATCH_LIMIT))
+        if not chunk:
+            break
+        
+        batch = [
+            {"method": "GET", "relative_url": f"{page_id}?fields=name,access_token,category"}
+            for page_id in chunk
+        ]
+        response = get_session().post(f"{GRAPH_API_BASE}/", data={
+            "access_token": user_access_token,
+            "batch": json.dumps(batch)
+        })
+        response.raise_for_status()
+        
+        # Each entry is {code, headers, body}, or null if that lookup timed out
+        for result in response.json():
+            if result and result.get("code") == 200:
+                pages.append(json.loads(result["body"]))
+    
+    return pages
+
+def fetch_token_bootstrap(user_access_token):
+    """
+    Validates a user access token and lists its pages in one Graph API batch call.
+    
+    Args:
+        user_access_token (str): User's Facebook access token
+        
+    Returns:
+        tuple: (me, pages_data) where me is the user's profile, or None if the
+            token is invalid, and pages_data is the me/accounts response
+    """
+    batch = [
+        {"method": "GET", "relative_url": "me"},
+        {"method": "GET", "relative_url": "me/accounts?fields=id,name,access_token"}
+    ]
+    response = get_session().post(f"{GRAPH_API_BASE}/", data={
+        "access_token": user_access_token,
+        "batch": json.dumps(batch)
+    })
+    
+    # An invalid or expired token fails the whole batch request
+    if response.status_code != 200:
+        return None, {"data": []}
+    
+    me_result, pages_result = response.json()
+    me = json.loads(me_result["body"]) if me_result and me_result.get("code") == 200 else None
+    if pages_result and pages_result.get("code") == 200:
+        pages_data = json.loads(pages_result["body"])
+    else:
+        pages_data = {"data": []}
+    
+    return me, pages_data
+
+def validate_page_tokens(pages):
+    """
+    Checks many page access tokens with Graph API batch requests, each lookup
+    carrying its own page token, sending up to GRAPH_BATCH_LIMIT per call.
+    
+    Args:
+        pages (list): Page dicts with 'id' and 'access_token'
+        
+    Returns:
+        bool: True if every token can read its page, False otherwise
+    """
+    remaining = iter(pages)
+    
+    while True:
+        chunk = list(islice(remaining, GRAPH_BATCH_LIMIT))
+        if not chunk:
+            return True
+        
+        batch = [
+            {"method": "GET", "relative_url": f"{page['id']}?{urlencode({'fields': 'id', 'access_token': page['access_token']})}"}
+            for page in chunk
+        ]
+        try:
+            # The top-level token is only a fallback; every lookup supplies its own
+            response = get_session().post(f"{GRAPH_API_BASE}/", data={
+                "access_token": chunk[0]["access_token"],
+                "batch": json.dumps(batch)
+            })
+        except requests.exceptions.RequestException:
+            return False
+        if response.status_code != 200:
+            return False
+        
+        # Each entry is {code, headers, body}, or null if that lookup timed out
+        if not all(result and result.get("code") == 200 for result in response.json()):
+            return False
+
 def post_to_page(message, page_token, page_id):
     """
     Posts a text message to a specific Facebook page.
@@ -91,7 +204,7 @@ def post_to_page(message, page_token, page_id):
         "message": message,
         "access_token": page_token
     }
-    response = requests.post(url, data=params)
+    response = get_session().post(url, data=params)
     print("Response text:", response.text)  
     response.raise_for_status()
     return response.json()
@@ -149,7 +262,7 @@ def post_with_media_to_page(message: str, page_token: str, page_id: str, media_f
                 'access_token': page_token
             }
             
-            response = requests.post(url, files=files, data=data)
+            response = get_session().post(url, files=files, data=data)
         else:
             # Text-only post
             url = f"https://graph.facebook.com/v19.0/{page_id}/feed"
@@ -157,7 +270,7 @@ def post_with_media_to_page(message: str, page_token: str, page_id: str, media_f
                 "message": message,
                 "access_token": page_token
             }
-            response = requests.post(url, data=data)
+            response = get_session().post(url, data=data)
         
         # Log the actual response for debugging
         print(f"Facebook API Response Status: {response.status_code}")
@@ -244,40 +357,38 @@ def load_facebook_credentials() -> Optional[Dict[str, Any]]:
             
             # Fallback to file if database failed or had no credentials
             secure_path = "app/secure/facebook_token.json"
-            if os.path.exists(secure_path):
-                try:
-                    with open(secure_path, 'r') as f:
-                        token_data = json.load(f)
-                        if token_data.get("data") and len(token_data["data"]) > 0:
-                            # Return the first page's credentials
-                            first_page = token_data["data"][0]
-                            print("✅ Facebook credentials loaded from file (fallback)")
-                            return {
-                                "page_id": first_page["id"],
-                                "page_token": first_page["access_token"],
-                                "page_name": first_page.get("name", "Unknown Page")
-                            }
-                except Exception as e:
-                    print(f"Error reading Facebook file: {e}")
-            
-            print("❌ No Facebook credentials found in database or file")
-            return None
-        
-        else:
-            # Database disabled - only try file
-            secure_path = "app/secure/facebook_token.json"
-            if os.path.exists(secure_path):
-                with open(secure_path, 'r') as f:
-                    token_data = json.load(f)
+            try:
+                token_data = cached_load(secure_path)
+                if token_data is not None:
                     if token_data.get("data") and len(token_data["data"]) > 0:
                         # Return the first page's credentials
                         first_page = token_data["data"][0]
-                        print("✅ Facebook credentials loaded from file")
+                        print("✅ Facebook credentials loaded from file (fallback)")
                         return {
                             "page_id": first_page["id"],
                             "page_token": first_page["access_token"],
                             "page_name": first_page.get("name", "Unknown Page")
                         }
+            except Exception as e:
+                print(f"Error reading Facebook file: {e}")
+            
+            print("❌ No Facebook credentials found in database or file")
+            return None
+        
+        else:
+            # Database disabled - only try file
+            secure_path = "app/secure/facebook_token.json"
+            token_data = cached_load(secure_path)
+            if token_data is not None:
+                if token_data.get("data") and len(token_data["data"]) > 0:
+                    # Return the first page's credentials
+                    first_page = token_data["data"][0]
+                    print("✅ Facebook credentials loaded from file")
+                    return {
+                        "page_id": first_page["id"],
+                        "page_token": first_page["access_token"],
+                        "page_name": first_page.get("name", "Unknown Page")
+                    }
             
             print("❌ No Facebook credentials found in file")
             return None
@@ -307,7 +418,7 @@ def update_page_profile_picture(page_token: str, page_id: str, image_file) -> Di
             'access_token': page_token
         }
         
-        response = requests.post(url, files=files, data=data)
+        response = get_session().post(url, files=files, data=data)
         response.raise_for_status()
         result = response.json()
         
@@ -354,7 +465,7 @@ def update_page_cover_photo(page_token: str, page_id: str, image_file) -> Dict[s
             'access_token': page_token
         }
         
-        upload_response = requests.post(upload_url, files=files, data=upload_data)
+        upload_response = get_session().post(upload_url, files=files, data=upload_data)
         upload_response.raise_for_status()
         upload_result = upload_response.json()
         
@@ -373,7 +484,7 @@ def update_page_cover_photo(page_token: str, page_id: str, image_file) -> Dict[s
             'access_token': page_token
         }
         
-        cover_response = requests.post(cover_url, data=cover_data)
+        cover_response = get_session().post(cover_url, data=cover_data)
         cover_response.raise_for_status()
         cover_result = cover_response.json()
         
@@ -1,7 +1,7 @@
 import requests
-import json
-import os
 from typing import Optional, Dict, Any
+from app.platforms._cred_cache import cached_load
+from app.http.session import get_session
 
 GRAPH_API_BASE = "https://graph.instagram.com"
 
@@ -22,7 +22,7 @@ def get_instagram_business_account(access_token):
         pages_params = {
             "access_token": access_token
         }
-        pages_response = requests.get(pages_url, params=pages_params)
+        pages_response = get_session().get(pages_url, params=pages_params)
         print("Pages response:", pages_response.text)
         pages_response.raise_for_status()
         pages_data = pages_response.json()
@@ -38,7 +38,7 @@ def get_instagram_business_account(access_token):
                 "fields": "instagram_business_account",
                 "access_token": page_token
             }
-            ig_response = requests.get(ig_url, params=ig_params)
+            ig_response = get_session().get(ig_url, params=ig_params)
             
             if ig_response.status_code == 200:
                 ig_data = ig_response.json()
@@ -52,7 +52,7 @@ def get_instagram_business_account(access_token):
                         "fields": "id,username,name,profile_picture_url",
                         "access_token": page_token
                     }
-                    detail_response = requests.get(detail_url, params=detail_params)
+                    detail_response = get_session().get(detail_url, params=detail_params)
                     
                     if detail_response.status_code == 200:
                         detail_data = detail_response.json()
@@ -74,6 +74,28 @@ def get_instagram_business_account(access_token):
         print("General error:", str(e))
         raise
 
+def validate_instagram_token(access_token: str, ig_user_id: str) -> bool:
+    """
+    Checks that a stored page token can still read the Instagram Business Account.
+    
+    Args:
+        access_token (str): Page access token used for Instagram API calls
+        ig_user_id (str): Instagram Business Account ID
+        
+    Returns:
+        bool: True if the token is still valid, False otherwise
+    """
+    url = f"https://graph.facebook.com/v19.0/{ig_user_id}"
+    params = {
+        "fields": "id",
+        "access_token": access_token
+    }
+    try:
+        response = get_session().get(url, params=params)
+    except requests.exceptions.RequestException:
+        return False
+    return response.status_code == 200
+
 def post_to_instagram(message: str, access_token: str, ig_user_id: str, media_file=None) -> Dict[str, Any]:
     """
     Posts content to Instagram Business account with media attachment.
@@ -137,7 +159,7 @@ def post_to_instagram(message: str, access_token: str, ig_user_id: str, media_fi
             with open(temp_file_path, 'rb') as f:
                 fb_files = {'source': (media_file.name, f, media_file.type)}
                 print("Uploading media to Facebook for URL hosting...")
-                fb_response = requests.post(fb_upload_url, data=fb_upload_data, files=fb_files)
+                fb_response = get_session().post(fb_upload_url, data=fb_upload_data, files=fb_files)
             
             print(f"Facebook upload response: {fb_response.text}")
             
@@ -161,7 +183,7 @@ def post_to_instagram(message: str, access_token: str, ig_user_id: str, media_fi
                 }
             
             # Get the actual image URL
-            photo_url_response = requests.get(
+            photo_url_response = get_session().get(
                 f"https://graph.facebook.com/v19.0/{photo_id}",
                 params={
                     'fields': 'images',
@@ -201,7 +223,7 @@ def post_to_instagram(message: str, access_token: str, ig_user_id: str, media_fi
             }
             
             print(f"Creating Instagram media container with data: {create_data}")
-            create_response = requests.post(create_url, data=create_data)
+            create_response = get_session().post(create_url, data=create_data)
             
             print(f"Instagram create response: {create_response.text}")
             create_response.raise_for_status()
@@ -223,7 +245,7 @@ def post_to_instagram(message: str, access_token: str, ig_user_id: str, media_fi
             }
             
             print(f"Publishing Instagram media with data: {publish_data}")
-            publish_response = requests.post(publish_url, data=publish_data)
+            publish_response = get_session().post(publish_url, data=publish_data)
             print(f"Instagram publish response: {publish_response.text}")
             publish_response.raise_for_status()
             result = publish_response.json()
@@ -302,19 +324,18 @@ def load_instagram_credentials() -> Optional[Dict[str, Any]]:
             
             # Fallback to file if database failed or had no credentials
             secure_path = "app/secure/instagram_token.json"
-            if os.path.exists(secure_path):
-                try:
-                    with open(secure_path, 'r') as f:
-                        token_data = json.load(f)
-                        if token_data.get("ig_user_id"):
-                            print("✅ Instagram credentials loaded from file (fallback)")
-                            return {
-                                "ig_user_id": token_data.get("ig_user_id"),
-                                "access_token": token_data.get("access_token"),
-                                "username": token_data.get("username", "Instagram Account")
-                            }
-                except Exception as e:
-                    print(f"Error reading Instagram file: {e}")
+            try:
+                token_data = cached_load(secure_path)
+                if token_data is not None:
+                    if token_data.get("ig_user_id"):
+                        print("✅ Instagram credentials loaded from file (fallback)")
+                        return {
+                            "ig_user_id": token_data.get("ig_user_id"),
+                            "access_token": token_data.get("access_token"),
+                            "username": token_data.get("username", "Instagram Account")
+                        }
+            except Exception as e:
+                print(f"Error reading Instagram file: {e}")
             
             print("❌ No Instagram credentials found in database or file")
             return None
@@ -322,16 +343,15 @@ def load_instagram_credentials() -> Optional[Dict[str, Any]]:
         else:
             # Database disabled - only try file
             secure_path = "app/secure/instagram_token.json"
-            if os.path.exists(secure_path):
-                with open(secure_path, 'r') as f:
-                    token_data = json.load(f)
-                    if token_data.get("ig_user_id"):
-                        print("✅ Instagram credentials loaded from file")
-                        return {
-                            "ig_user_id": token_data.get("ig_user_id"),
-                            "access_token": token_data.get("access_token"),
-                            "username": token_data.get("username", "Instagram Account")
-                        }
+            token_data = cached_load(secure_path)
+            if token_data is not None:
+                if token_data.get("ig_user_id"):
+                    print("✅ Instagram credentials loaded from file")
+                    return {
+                        "ig_user_id": token_data.get("ig_user_id"),
+                        "access_token": token_data.get("access_token"),
+                        "username": token_data.get("username", "Instagram Account")
+                    }
             
             print("❌ No Instagram credentials found in file")
             return None
@@ -360,7 +380,7 @@ def get_instagram_media(access_token: str, ig_user_id: str, limit: int = 25) ->
             "access_token": access_token
         }
         
-        response = requests.get(url, params=params)
+        response = get_session().get(url, params=params)
         response.raise_for_status()
         result = response.json()
         
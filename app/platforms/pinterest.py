@@ -24,6 +24,8 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from app.config import USE_DATABASE
+from app.platforms._cred_cache import cached_load
+from app.http.session import get_session
 
 # Pinterest API v5 endpoints
 PINTEREST_API_BASE = "https://api.pinterest.com/v5"
@@ -56,7 +58,7 @@ def load_pinterest_credentials() -> Optional[Dict]:
                 LIMIT 1
                 """
                 
-                result = execute_query(query)
+                result = execute_query(query, fetch=True)
                 
                 if result:
                     row = result[0]
@@ -84,15 +86,13 @@ def load_pinterest_credentials() -> Optional[Dict]:
                 "pinterest_token.json"
             )
             
-            if os.path.exists(file_path):
-                try:
-                    with open(file_path, 'r') as f:
-                        credentials = json.load(f)
-                        if credentials:
-                            print("✅ Pinterest credentials loaded from file (fallback)")
-                            return credentials
-                except Exception as e:
-                    print(f"Error reading Pinterest file: {e}")
+            try:
+                credentials = cached_load(file_path)
+                if credentials:
+                    print("✅ Pinterest credentials loaded from file (fallback)")
+                    return credentials
+            except Exception as e:
+                print(f"Error reading Pinterest file: {e}")
             
             print("❌ No Pinterest credentials found in database or file")
             return None
@@ -105,12 +105,10 @@ def load_pinterest_credentials() -> Optional[Dict]:
                 "pinterest_token.json"
             )
             
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    credentials = json.load(f)
-                    if credentials:
-                        print("✅ Pinterest credentials loaded from file")
-                        return credentials
+            credentials = cached_load(file_path)
+            if credentials:
+                print("✅ Pinterest credentials loaded from file")
+                return credentials
             
             print("❌ No Pinterest credentials found in file")
             return None
@@ -152,7 +150,7 @@ def upload_media_to_pinterest(media_file, access_token: str) -> Dict:
                 'file': (media_file.name, f, media_file.type)
             }
             
-            response = requests.post(
+            response = get_session().post(
                 f"{PINTEREST_API_BASE}/media",
                 headers=headers,
                 files=files
@@ -196,7 +194,7 @@ def get_user_boards(access_token: str) -> List[Dict]:
     }
     
     try:
-        response = requests.get(f"{PINTEREST_API_BASE}/boards", headers=headers)
+        response = get_session().get(f"{PINTEREST_API_BASE}/boards", headers=headers)
         response.raise_for_status()
         
         boards_data = response.json()
@@ -249,7 +247,7 @@ def create_pin(access_token: str, board_id: str, title: str, description: str, m
         pin_data["link"] = link
     
     try:
-        response = requests.post(
+        response = get_session().post(
             f"{PINTEREST_API_BASE}/pins",
             headers=headers,
             json=pin_data
@@ -391,7 +389,7 @@ def get_pinterest_user_info(access_token: str) -> Dict:
     }
     
     try:
-        response = requests.get(f"{PINTEREST_API_BASE}/user_account", headers=headers)
+        response = get_session().get(f"{PINTEREST_API_BASE}/user_account", headers=headers)
         response.raise_for_status()
         
         user_data = response.json()
@@ -1,7 +1,7 @@
 import requests
-import json
-import os
 from typing import Optional, Dict, Any
+from app.platforms._cred_cache import cached_load
+from app.http.session import get_session
 
 API_BASE_URL = "https://open-api.tiktok.com"
 
@@ -21,7 +21,7 @@ def get_user_info(access_token: str) -> Dict[str, Any]:
         'Content-Type': 'application/json'
     }
     
-    response = requests.get(url, headers=headers)
+    response = get_session().get(url, headers=headers)
     response.raise_for_status()
     result = response.json()
     
@@ -68,7 +68,7 @@ def upload_video(access_token: str, video_file, caption: str = "", privacy_level
             }
         }
         
-        response = requests.post(init_url, json=init_data, headers=headers)
+        response = get_session().post(init_url, json=init_data, headers=headers)
         response.raise_for_status()
         init_result = response.json()
         
@@ -82,7 +82,7 @@ def upload_video(access_token: str, video_file, caption: str = "", privacy_level
         video_file.seek(0)
         files = {'video': (video_file.name, video_file.getvalue(), 'video/mp4')}
         
-        upload_response = requests.put(upload_url, files=files)
+        upload_response = get_session().put(upload_url, files=files)
         upload_response.raise_for_status()
         
         # Step 3: Publish video
@@ -91,7 +91,7 @@ def upload_video(access_token: str, video_file, caption: str = "", privacy_level
             'post_id': publish_id
         }
         
-        publish_response = requests.post(publish_url, json=publish_data, headers=headers)
+        publish_response = get_session().post(publish_url, json=publish_data, headers=headers)
         publish_response.raise_for_status()
         publish_result = publish_response.json()
         
@@ -198,18 +198,17 @@ def load_tiktok_credentials() -> Optional[Dict[str, Any]]:
             
             # Fallback to file if database failed or had no credentials
             secure_path = "app/secure/tiktok_token.json"
-            if os.path.exists(secure_path):
-                try:
-                    with open(secure_path, 'r') as f:
-                        token_data = json.load(f)
-                        print("✅ TikTok credentials loaded from file (fallback)")
-                        return {
-                            "access_token": token_data["access_token"],
-                            "open_id": token_data.get("open_id", "unknown"),
-                            "display_name": token_data.get("display_name", "TikTok User")
-                        }
-                except Exception as e:
-                    print(f"Error reading TikTok file: {e}")
+            try:
+                token_data = cached_load(secure_path)
+                if token_data is not None:
+                    print("✅ TikTok credentials loaded from file (fallback)")
+                    return {
+                        "access_token": token_data["access_token"],
+                        "open_id": token_data.get("open_id", "unknown"),
+                        "display_name": token_data.get("display_name", "TikTok User")
+                    }
+            except Exception as e:
+                print(f"Error reading TikTok file: {e}")
             
             print("❌ No TikTok credentials found in database or file")
             return None
@@ -217,15 +216,14 @@ def load_tiktok_credentials() -> Optional[Dict[str, Any]]:
         else:
             # Database disabled - only try file
             secure_path = "app/secure/tiktok_token.json"
-            if os.path.exists(secure_path):
-                with open(secure_path, 'r') as f:
-                    token_data = json.load(f)
-                    print("✅ TikTok credentials loaded from file")
-                    return {
-                        "access_token": token_data["access_token"],
-                        "open_id": token_data.get("open_id", "unknown"),
-                        "display_name": token_data.get("display_name", "TikTok User")
-                    }
+            token_data = cached_load(secure_path)
+            if token_data is not None:
+                print("✅ TikTok credentials loaded from file")
+                return {
+                    "access_token": token_data["access_token"],
+                    "open_id": token_data.get("open_id", "unknown"),
+                    "display_name": token_data.get("display_name", "TikTok User")
+                }
             
             print("❌ No TikTok credentials found in file")
             return None
@@ -257,7 +255,7 @@ def get_user_videos(access_token: str, cursor: int = 0, max_count: int = 20) ->
         'max_count': max_count
     }
     
-    response = requests.get(url, headers=headers, params=params)
+    response = get_session().get(url, headers=headers, params=params)
     response.raise_for_status()
     result = response.json()
     
@@ -14,6 +14,7 @@ import requests
 from requests_oauthlib import OAuth1Session
 from urllib.parse import urlparse
 from app.auth.tumblr_auth import load_tumblr_credentials
+from app.http.session import share_pool
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -36,12 +37,12 @@ def create_oauth_session(access_token, access_token_secret):
     client_key = os.getenv('TUMBLR_CLIENT_ID')
     client_secret = os.getenv('TUMBLR_CLIENT_SECRET')
     
-    return OAuth1Session(
+    return share_pool(OAuth1Session(
         client_key,
         client_secret=client_secret,
         resource_owner_key=access_token,
         resource_owner_secret=access_token_secret
-    )
+    ))
 
 def upload_media_to_tumblr(media_path, access_token, access_token_secret):
     """
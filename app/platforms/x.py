@@ -28,7 +28,8 @@ from app.config import (
     X_CLIENT_ID, X_CLIENT_SECRET, X_ACCESS_TOKEN, X_ACCESS_TOKEN_SECRET,
     X_API_KEY, X_API_SECRET
 )
-from app.auth.x_auth import get_valid_access_token, load_x_credentials
+from app.auth.x_auth import get_valid_access_token, get_user_info, load_x_credentials
+from app.http.session import get_session
 
 
 def upload_media_to_x(media_path, access_token=None, access_token_secret=None):
@@ -173,7 +174,7 @@ def create_x_post(text, media_paths=None, access_token=None):
             'Content-Type': 'application/json'
         }
         
-        response = requests.post(url, json=tweet_data, headers=headers)
+        response = get_session().post(url, json=tweet_data, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -252,7 +253,7 @@ def get_user_profile():
             'Content-Type': 'application/json'
         }
         
-        response = requests.get(url, headers=headers)
+        response = get_session().get(url, headers=headers)
         response.raise_for_status()
         
         result = response.json()
@@ -280,8 +281,10 @@ def test_x_connection():
                 'details': 'Run X authentication setup'
             }
         
-        # Test API call
-        user_info = get_user_profile()
+        # get_valid_access_token has already validated (or refreshed) the token,
+        # so fetch the user with it directly rather than through get_user_profile,
+        # which would validate it again
+        user_info = get_user_info(token)
         if user_info and 'id' in user_info:
             return {
                 'success': True,
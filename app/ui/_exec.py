@@ -0,0 +1,21 @@
+"""
+Shared Worker Pool for Social Media Scheduler
+
+A single process-wide thread pool reused by every session for I/O-bound work
+such as publishing to platforms and prefetching credentials, so threads are
+not created and torn down on each click.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+# Enough for every implemented platform plus a concurrent credential prefetch
+MAX_WORKERS = 8
+
+
+# No spinner: first reached from initialize_session_state, before set_page_config
+@st.cache_resource(show_spinner=False)
+def get_executor() -> ThreadPoolExecutor:
+    """Get the process-wide worker pool, creating it on first use."""
+    return ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="sms")
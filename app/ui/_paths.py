@@ -0,0 +1,32 @@
+"""
+Data Directories for Social Media Scheduler
+
+Holds the directories the dashboard writes uploads and drafts into, and a
+helper that creates each directory at most once per process.
+"""
+
+import os
+from pathlib import Path
+
+# Relative to the working directory, which main.py sets to the project root
+MEDIA_DIR = Path("data") / "media"
+DRAFTS_DIR = Path("data") / "drafts"
+
+# Directories already created by this process
+_ENSURED = set()
+
+
+def ensure_dir(path: Path) -> Path:
+    """
+    Create a directory if needed, skipping the syscall once it is known to exist.
+    
+    Args:
+        path (Path): Directory to create
+        
+    Returns:
+        Path: The same directory, for chaining into path joins
+    """
+    if path not in _ENSURED:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED.add(path)
+    return path
@@ -0,0 +1,28 @@
+"""
+Bytecode Warm-up for Social Media Scheduler
+
+Precompiles the app package so a fresh Streamlit process loads cached
+bytecode from __pycache__ instead of compiling every imported module from
+source on the first run.
+"""
+
+import compileall
+from pathlib import Path
+
+APP_DIR = Path(__file__).parent.parent
+
+
+def precompile_app() -> bool:
+    """
+    Compile all modules under app/ to .pyc files.
+
+    Up-to-date files are skipped, so repeat calls are cheap.
+
+    Returns:
+        bool: True if every module compiled successfully
+    """
+    return bool(compileall.compile_dir(str(APP_DIR), quiet=1))
+
+
+if __name__ == "__main__":
+    precompile_app()
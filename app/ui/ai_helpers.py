@@ -122,4 +122,23 @@ def is_ai_available() -> bool:
 def get_ai_model_info() -> dict:
     """Get information about the current AI model."""
     processor = get_ai_processor()
-    return processor.get_model_info() 
\ No newline at end of file
+    return processor.get_model_info()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_ai_status(provider: str) -> dict:
+    """
+    Get cached AI availability and model info for the selected provider.
+    
+    Args:
+        provider (str): The AI provider selected in the dashboard
+        
+    Returns:
+        dict: {"available": bool, "model": dict}
+    """
+    return {"available": is_ai_available(), "model": get_ai_model_info()}
+
+
+def clear_ai_status():
+    """Drop the cached AI status so the next lookup probes the provider again."""
+    get_ai_status.clear()
@@ -0,0 +1,66 @@
+"""
+UI Constants for Social Media Scheduler
+
+This module holds the static platform lists and display strings used by the
+dashboard. Streamlit re-executes the dashboard script on every rerun, so these
+are kept in an imported module to be built once per process instead.
+"""
+
+# All platforms shown in the dashboard, in display order
+AVAILABLE_PLATFORMS = ["Facebook", "Instagram", "Pinterest", "X", "TikTok", "Threads", "Tumblr"]
+
+# Platforms with a working posting integration
+IMPLEMENTED_PLATFORMS = frozenset({"Facebook", "Instagram", "Pinterest", "Tumblr", "X"})
+
+AI_PROVIDERS = ["Anthropic", "OpenAI", "Gemini"]
+
+# Platform name -> (checkbox label, widget key, help text, disabled)
+PLATFORM_DISPLAY = {
+    platform: (
+        f"✅ {platform}" if platform in IMPLEMENTED_PLATFORMS else f"🔄 {platform}",
+        f"platform_{platform}",
+        f"Post to {platform}" if platform in IMPLEMENTED_PLATFORMS else f"{platform} - Coming soon",
+        platform not in IMPLEMENTED_PLATFORMS
+    )
+    for platform in AVAILABLE_PLATFORMS
+}
+
+# (post_now, platform count) -> submit button label
+BUTTON_TEXT = {
+    (post_now, count): (
+        f"🚀 Publish to {count} Platform{'s' if count > 1 else ''}" if post_now
+        else f"📅 Schedule for {count} Platform{'s' if count > 1 else ''}"
+    )
+    for post_now in (True, False)
+    for count in range(1, len(AVAILABLE_PLATFORMS) + 1)
+}
+
+# Platform name -> sidebar status metadata: setup script and connected-account detail lines
+PLATFORM_META = {
+    "Facebook": {
+        "setup": "facebook_setup.py",
+        "details": lambda c: [f"Page: {c['page_name']}"],
+    },
+    "Instagram": {
+        "setup": "instagram_setup.py",
+        "details": lambda c: [f"Account: @{c['username']}"],
+    },
+    "Pinterest": {
+        "setup": "pinterest_setup.py",
+        "details": lambda c: [f"Account: @{c['username']}"] + (
+            [f"Boards: {len(c['boards'])} available"] if c.get('boards') else []
+        ),
+    },
+    "Tumblr": {
+        "setup": "tumblr_setup.py",
+        "details": lambda c: [f"Account: @{c.get('username', 'Unknown')}"] + (
+            [f"Blog: {c['blog_title']}"] if c.get('blog_title') else []
+        ),
+    },
+    "X": {
+        "setup": "x_setup.py",
+        "details": lambda c: [f"Account: @{c.get('username', 'Unknown')}"] + (
+            [f"Name: {c['name']}"] if c.get('name') else []
+        ),
+    },
+}
@@ -5,8 +5,22 @@ This module handles the initialization and management of Streamlit session state
 for the social media scheduler application.
 """
 
+from dataclasses import dataclass
+
 import streamlit as st
 
+from app.ui.constants import AVAILABLE_PLATFORMS, PLATFORM_META
+
+
+@dataclass
+class PlatformStatusRow:
+    """Sidebar connection status for one platform, built once from its credentials."""
+    __slots__ = ("connected", "details", "setup_script")
+    
+    connected: bool
+    details: list
+    setup_script: str
+
 
 def initialize_session_state():
     """Initialize all session state variables with their default values."""
@@ -25,7 +39,7 @@ def initialize_session_state():
     
     # UI preferences
     if 'selected_platforms' not in st.session_state:
-        st.session_state.selected_platforms = ["Facebook"]
+        st.session_state.selected_platforms = {"Facebook"}
     if 'ai_provider' not in st.session_state:
         st.session_state.ai_provider = "Anthropic"
     if 'post_now' not in st.session_state:
@@ -40,6 +54,14 @@ def initialize_session_state():
     # UI state management
     if 'clear_counter' not in st.session_state:
         st.session_state.clear_counter = 0
+    
+    # Platform credentials, keyed by lowercase platform name and loaded on first use
+    if 'creds' not in st.session_state:
+        st.session_state.creds = {}
+    if 'cred_futures' not in st.session_state:
+        st.session_state.cred_futures = prefetch_credentials()
+    if 'platform_rows' not in st.session_state:
+        st.session_state.platform_rows = {}
 
 
 def clear_content():
@@ -88,6 +110,120 @@ def is_any_operation_in_progress() -> bool:
             st.session_state.ai_processing)
 
 
+def get_selected_platforms() -> list:
+    """Get the selected platforms in display order."""
+    selected = st.session_state.selected_platforms
+    return [platform for platform in AVAILABLE_PLATFORMS if platform in selected]
+
+
+def _credential_loaders() -> dict:
+    """Return the credential loaders keyed by lowercase platform name."""
+    from app.platforms.facebook import load_facebook_credentials
+    from app.platforms.instagram import load_instagram_credentials
+    from app.platforms.pinterest import load_pinterest_credentials
+    from app.platforms.tumblr import load_tumblr_credentials
+    from app.platforms.x import load_x_credentials
+    
+    return {
+        "facebook": load_facebook_credentials,
+        "instagram": load_instagram_credentials,
+        "pinterest": load_pinterest_credentials,
+        "tumblr": load_tumblr_credentials,
+        "x": load_x_credentials,
+    }
+
+
+def prefetch_credentials() -> dict:
+    """
+    Start loading every platform's credentials on the shared worker pool.
+    
+    Returns:
+        dict: Lowercase platform name -> Future resolving to its credentials
+    """
+    try:
+        from app.ui._exec import get_executor
+        loaders = _credential_loaders()
+    except ImportError:
+        return {}
+    
+    executor = get_executor()
+    return {key: executor.submit(loader) for key, loader in loaders.items()}
+
+
+def get_cached_credentials(platform: str):
+    """
+    Get a platform's credentials, loading them once per session.
+    
+    Args:
+        platform (str): Platform name, e.g. "Facebook"
+        
+    Returns:
+        dict or None: Stored credentials, or None if not configured
+    """
+    key = platform.lower()
+    creds = st.session_state.creds
+    if key not in creds:
+        future = st.session_state.cred_futures.pop(key, None)
+        if future is not None:
+            creds[key] = future.result()
+        else:
+            loader = _credential_loaders().get(key)
+            creds[key] = loader() if loader else None
+    return creds[key]
+
+
+def get_platform_status(platform: str) -> PlatformStatusRow:
+    """
+    Get a platform's sidebar status row, building it once per credentials load.
+    
+    Args:
+        platform (str): Platform name with an entry in PLATFORM_META
+        
+    Returns:
+        PlatformStatusRow: Connection state, account detail lines and setup script
+    """
+    rows = st.session_state.platform_rows
+    row = rows.get(platform)
+    if row is None:
+        meta = PLATFORM_META[platform]
+        creds = get_cached_credentials(platform)
+        row = PlatformStatusRow(
+            connected=bool(creds),
+            details=meta["details"](creds) if creds else [],
+            setup_script=meta["setup"]
+        )
+        rows[platform] = row
+    return row
+
+
+def invalidate_creds_cache(platform: str = None):
+    """
+    Drop cached credentials so they are reloaded on next use.
+    
+    Args:
+        platform (str, optional): Platform to invalidate; all platforms if omitted
+    """
+    if platform is None:
+        st.session_state.creds = {}
+        st.session_state.platform_rows = {}
+        st.session_state.cred_futures = prefetch_credentials()
+    else:
+        st.session_state.creds.pop(platform.lower(), None)
+        st.session_state.platform_rows.pop(platform, None)
+        st.session_state.cred_futures.pop(platform.lower(), None)
+
+
+def compose_full_content(title: str, text: str) -> str:
+    """Join the title and body into the text that gets posted."""
+    return f"{title}\n\n{text}" if title else text
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def content_stats(text: str) -> dict:
+    """Get the character and word counts for the content analytics panel."""
+    return {"len": len(text), "words": len(text.split())}
+
+
 def get_form_key_suffix() -> str:
     """Get a suffix for form input keys to force refresh when needed."""
     return f"_{st.session_state.clear_counter}"
@@ -97,7 +233,7 @@ def get_session_debug_info() -> dict:
     """Get debug information about the current session state."""
     return {
         "mode": "Post Now" if st.session_state.post_now else "Schedule",
-        "selected_platforms": st.session_state.selected_platforms,
+        "selected_platforms": get_selected_platforms(),
         "ai_provider": st.session_state.ai_provider,
         "posting_in_progress": st.session_state.posting_in_progress,
         "ai_processing": st.session_state.ai_processing,
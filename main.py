@@ -12,7 +12,8 @@ Usage:
 
 import sys
 import os
-import subprocess
+import threading
+import importlib
 from pathlib import Path
 
 # Add the project root to Python path
@@ -49,16 +50,24 @@ def load_environment():
         return True
 
 
-def initialise_scheduler():
-    """Initialise the background scheduler for post scheduling."""
+def _initialise_scheduler_worker():
+    """Import and start the scheduler, reporting failures to stderr."""
     try:
         from app.scheduler.apscheduler import scheduler
         print("✅ Background scheduler initialised")
-        return True
     except Exception as e:
-        print(f"⚠️  Warning: Could not initialise scheduler: {e}")
-        print("   Scheduled posting may not work properly")
-        return True  # Continue anyway as immediate posting should still work
+        print(f"⚠️  Warning: Could not initialise scheduler: {e}", file=sys.stderr)
+        print("   Scheduled posting may not work properly", file=sys.stderr)
+
+
+def initialise_scheduler():
+    """Initialise the background scheduler on a daemon thread so it overlaps with dashboard startup."""
+    threading.Thread(
+        target=_initialise_scheduler_worker,
+        name="scheduler-init",
+        daemon=True
+    ).start()
+    return True  # Failures are reported by the worker; immediate posting still works
 
 
 def validate_project_structure():
@@ -88,20 +97,30 @@ def check_platform_setup():
     """Check which platforms are configured and provide setup guidance."""
     platforms_status = {}
     
-    # Check for credential files or environment variables
+    # Check for credential files as (directory, filename) pairs
     credential_files = {
-        "Facebook": project_root / "app" / "secure" / "facebook_token.json",
-        "Instagram": project_root / "app" / "secure" / "instagram_token.json", 
-        "Pinterest": project_root / "app" / "secure" / "pinterest_token.json",
-        "Tumblr": project_root / "data" / "credentials" / "tumblr_credentials.json",
-        "X": project_root / "app" / "secure" / "x_token.json"
+        "Facebook": ("app/secure", "facebook_token.json"),
+        "Instagram": ("app/secure", "instagram_token.json"),
+        "Pinterest": ("app/secure", "pinterest_token.json"),
+        "Tumblr": ("data/credentials", "tumblr_credentials.json"),
+        "X": ("app/secure", "x_token.json")
     }
     
+    # List each credential directory once instead of stat-ing every file
+    dir_entries = {}
+    for cred_dir, _ in credential_files.values():
+        if cred_dir not in dir_entries:
+            try:
+                with os.scandir(project_root / cred_dir) as entries:
+                    dir_entries[cred_dir] = {entry.name for entry in entries}
+            except OSError:
+                dir_entries[cred_dir] = set()
+    
     configured_platforms = []
     unconfigured_platforms = []
     
-    for platform, cred_file in credential_files.items():
-        if cred_file.exists():
+    for platform, (cred_dir, filename) in credential_files.items():
+        if filename in dir_entries[cred_dir]:
             platforms_status[platform] = "✅ Configured"
             configured_platforms.append(platform)
         else:
@@ -124,8 +143,40 @@ def check_platform_setup():
     return True
 
 
+def precompile_app():
+    """Precompile the app package so the dashboard starts from cached bytecode."""
+    try:
+        from app.ui._warmup import precompile_app as _precompile
+        if _precompile():
+            print("✅ App modules precompiled")
+        else:
+            print("⚠️  Warning: Some app modules failed to precompile")
+    except Exception as e:
+        print(f"⚠️  Warning: Could not precompile app modules: {e}")
+    return True
+
+
+# Imported before launch so the first page render finds them loaded
+PREWARM_MODULES = (
+    "app.platforms.facebook",
+    "app.platforms.instagram",
+    "app.platforms.pinterest",
+    "app.platforms.tumblr",
+    "app.platforms.x",
+)
+
+
+def prewarm_dashboard():
+    """Import the platform modules before the first page render."""
+    try:
+        for module in PREWARM_MODULES:
+            importlib.import_module(module)
+    except Exception as e:
+        print(f"⚠️  Warning: Could not prewarm dashboard: {e}")
+
+
 def launch_streamlit():
-    """Launch the Streamlit dashboard."""
+    """Launch the Streamlit dashboard in this process."""
     dashboard_path = project_root / "app" / "ui" / "dashboard.py"
     
     if not dashboard_path.exists():
@@ -138,16 +189,20 @@ def launch_streamlit():
     print(f"\n💡 Use Ctrl+C to stop the application")
     
     try:
-        # Launch Streamlit with proper configuration
-        cmd = [
-            sys.executable, "-m", "streamlit", "run", 
-            str(dashboard_path),
-            "--server.headless", "true",
-            "--server.port", "8501",
-            "--server.address", "localhost"
-        ]
+        from streamlit.web import bootstrap
+        
+        # Credential and media paths are relative to the project root
+        os.chdir(project_root)
+        prewarm_dashboard()
         
-        subprocess.run(cmd, cwd=str(project_root))
+        # Launch Streamlit with proper configuration
+        flag_options = {
+            "server_headless": True,
+            "server_port": 8501,
+            "server_address": "localhost"
+        }
+        bootstrap.load_config_options(flag_options=flag_options)
+        bootstrap.run(str(dashboard_path), False, [], flag_options)
         return True
         
     except KeyboardInterrupt:
@@ -214,6 +269,9 @@ def main():
     # Show help information
     print_help()
     
+    # Warm the bytecode cache before Streamlit imports the app
+    precompile_app()
+    
     # Launch the application
     print(f"\n" + "=" * 60)
     success = launch_streamlit()
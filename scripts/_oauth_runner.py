@@ -0,0 +1,181 @@
+"""
+Shared OAuth Setup Flow
+
+The TikTok, Tumblr and X setup scripts all walk the same steps: reuse saved
+credentials if possible, check the environment, send the user to the
+authorization URL, read back the callback URL, exchange it for tokens, fetch
+the account, save it and test it. This module runs those steps once; each
+script only describes its provider with a ProviderSpec.
+
+Usage (from a script in this directory):
+    from _oauth_runner import ProviderSpec, run_oauth_setup
+"""
+
+import os
+import webbrowser
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+
+@dataclass
+class ProviderSpec:
+    """
+    Callables and settings describing one provider's OAuth setup.
+
+    build_auth_url returns (auth_url, flow), where flow is whatever the later
+    steps need from the authorization request (state, PKCE verifier, request
+    token). parse_callback raises ValueError when the pasted URL is unusable,
+    and the user is asked again.
+    """
+    name: str
+    required_env: Tuple[str, ...]
+    build_auth_url: Callable[[], Tuple[str, Any]]
+    parse_callback: Callable[[str, Any], Any]
+    exchange: Callable[[Any, Any], Optional[dict]]
+    userinfo: Callable[[dict], Optional[dict]]
+    save: Callable[[dict, dict], bool]
+    test: Optional[Callable[[dict], bool]] = None
+    reuse_saved: Optional[Callable[[], bool]] = None
+    env_help: str = ""
+    redirect_env: Optional[str] = None
+
+
+def extract_callback_params(url: str, keys: Tuple[str, ...]) -> Dict[str, str]:
+    """
+    Pull the wanted query parameters out of a callback URL.
+
+    Args:
+        url (str): Callback URL pasted by the user
+        keys (tuple): Parameter names to keep
+
+    Returns:
+        dict: The first non-blank value of each key present in the URL
+    """
+    params = {}
+    for key, value in parse_qsl(urlsplit(url).query):
+        if key in keys:
+            params.setdefault(key, value)
+    return params
+
+
+def check_environment(spec: ProviderSpec) -> Optional[Dict[str, str]]:
+    """
+    Check that the provider's required environment variables are set.
+
+    Returns:
+        dict: Value of each required variable, or None if any are missing
+    """
+    # app.config normally loads .env, but the provider modules are imported lazily
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    env = os.environ
+    missing_vars = [var for var in spec.required_env if not env.get(var)]
+
+    if missing_vars:
+        print("❌ Missing required environment variables:")
+        for var in missing_vars:
+            print(f"   - {var}")
+        if spec.env_help:
+            print(f"\n{spec.env_help}")
+        return None
+
+    values = {var: env[var] for var in spec.required_env}
+
+    print("✅ Environment variables found")
+    print("\n📋 Current Configuration:")
+    for var, value in values.items():
+        if "SECRET" in var:
+            value = "*" * 20
+        elif "REDIRECT" not in var:
+            value = f"{value[:10]}..."
+        print(f"   {var}: {value}")
+
+    return values
+
+
+def read_callback(spec: ProviderSpec, flow):
+    """
+    Prompt for the callback URL until the provider can parse it.
+
+    Returns:
+        The parsed callback parameters, or None if the user gave no URL
+    """
+    while True:
+        callback_url = input("\n📝 Please paste the full callback URL here: ").strip()
+
+        if not callback_url:
+            print("❌ No URL provided.")
+            return None
+
+        try:
+            return spec.parse_callback(callback_url, flow)
+        except ValueError as e:
+            print(f"❌ {e}. Please try again.")
+
+
+def run_oauth_setup(spec: ProviderSpec) -> bool:
+    """
+    Run the authorization flow for a provider and save the resulting account.
+
+    Args:
+        spec (ProviderSpec): Provider to set up
+
+    Returns:
+        bool: True if the provider is ready to use
+    """
+    try:
+        # Saved (or refreshable) credentials make the client settings and the
+        # browser flow unnecessary, so they are tried before anything is required
+        if spec.reuse_saved and spec.reuse_saved():
+            return True
+
+        env = check_environment(spec)
+        if env is None:
+            return False
+
+        print(f"\n🔗 Getting {spec.name} authorization URL...")
+        auth_url, flow = spec.build_auth_url()
+        if not auth_url:
+            print("❌ Failed to generate authorization URL")
+            return False
+
+        print("\n🌐 Please authorize the app at this URL:")
+        print(f"   {auth_url}")
+        try:
+            webbrowser.open(auth_url)
+        except Exception as e:
+            print(f"⚠️  Could not open browser automatically: {e}")
+
+        print("\n📥 After authorizing, you'll be redirected to your callback URL.")
+        if spec.redirect_env:
+            print(f"   {env[spec.redirect_env]}")
+        print("   Copy the FULL URL from your browser and paste it below.")
+
+        params = read_callback(spec, flow)
+        if params is None:
+            return False
+
+        token_data = spec.exchange(params, flow)
+        if not token_data:
+            return False
+
+        user_info = spec.userinfo(token_data)
+        if not user_info:
+            return False
+
+        if not spec.save(token_data, user_info):
+            return False
+
+        if spec.test and not spec.test(user_info):
+            return False
+
+        return True
+
+    except KeyboardInterrupt:
+        print("\n\n❌ Setup cancelled by user")
+        return False
+    except Exception as e:
+        print(f"\n❌ Setup failed with error: {e}")
+        return False
@@ -9,53 +9,26 @@ Usage:
     python scripts/facebook_setup.py
 """
 
-import json
 import os
 import sys
 from pathlib import Path
 
+import orjson
+
 # Add the parent directory to the path to import app modules
 project_root = str(Path(__file__).parent.parent)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from app.auth.facebook_auth import get_facebook_login_url, fetch_facebook_token
-from app.platforms.facebook import get_user_pages
-from app.config import USE_DATABASE, FACEBOOK_ACCESS_TOKEN
+# Directory token files are saved to in file-based storage mode
+SECURE_DIR = Path(__file__).resolve().parent.parent / "app" / "secure"
 
-# Only import database functions if database is being used
-if USE_DATABASE:
-    from app.db.database import execute_query
+from app.config import USE_DATABASE, FACEBOOK_ACCESS_TOKEN
 
 
-def upsert_platform_account(platform, page_id, access_token, display_name):
-    """
-    Insert or update platform account in database.
-    
-    Args:
-        platform (str): Platform name (e.g., 'facebook')
-        page_id (str): Platform-specific page/account ID
-        access_token (str): Access token for the account
-        display_name (str): Human-readable name for the account
-    """
-    query_check = "SELECT id FROM platform_accounts WHERE page_id = %s AND platform = %s"
-    existing = execute_query(query_check, (page_id, platform), fetch=True)
-
-    if existing:
-        query_update = """
-            UPDATE platform_accounts
-            SET access_token = %s, display_name = %s
-            WHERE id = %s
-        """
-        execute_query(query_update, (access_token, display_name, existing[0]['id']))
-        print(f"✅ Updated token for page: {display_name}")
-    else:
-        query_insert = """
-            INSERT INTO platform_accounts (platform, page_id, access_token, display_name)
-            VALUES (%s, %s, %s, %s)
-        """
-        execute_query(query_insert, (platform, page_id, access_token, display_name))
-        print(f"✅ Inserted new platform account: {display_name}")
+def _dump_json(obj, path: Path):
+    """Write obj to path as indented JSON in one write."""
+    path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
 
 
 def save_facebook_tokens(token_data: dict) -> bool:
@@ -69,14 +42,9 @@ def save_facebook_tokens(token_data: dict) -> bool:
         bool: True if saved successfully, False otherwise
     """
     try:
-        # Ensure secure directory exists
-        secure_dir = Path(__file__).parent.parent / "app" / "secure"
-        secure_dir.mkdir(exist_ok=True)
-        
-        # Save token data
-        token_file = secure_dir / "facebook_token.json"
-        with open(token_file, 'w') as f:
-            json.dump(token_data, f, indent=2)
+        SECURE_DIR.mkdir(parents=True, exist_ok=True)
+        token_file = SECURE_DIR / "facebook_token.json"
+        _dump_json(token_data, token_file)
         
         print(f"✅ Facebook tokens saved to: {token_file}")
         return True
@@ -86,6 +54,31 @@ def save_facebook_tokens(token_data: dict) -> bool:
         return False
 
 
+def load_cached_pages():
+    """
+    Load page tokens saved by a previous run if they are still valid.
+    
+    Returns:
+        dict or None: Cached page data, or None if missing or no longer valid
+    """
+    token_file = SECURE_DIR / "facebook_token.json"
+    if not token_file.exists():
+        return None
+    
+    from app.platforms.facebook import validate_page_tokens
+    
+    try:
+        pages_data = orjson.loads(token_file.read_bytes())
+        pages = pages_data.get("data")
+        # Every cached page is re-saved, so every page token must still work
+        if pages and validate_page_tokens(pages):
+            return pages_data
+    except Exception as e:
+        print(f"⚠️  Could not read cached tokens: {e}")
+    
+    return None
+
+
 def process_pages(pages_data: dict) -> bool:
     """
     Process and save Facebook page data based on USE_DATABASE configuration.
@@ -98,14 +91,13 @@ def process_pages(pages_data: dict) -> bool:
     """
     try:
         if USE_DATABASE:
+            from app.db.platform_accounts import upsert_many
+            
             print("💾 Saving to database...")
-            for page in pages_data.get("data", []):
-                upsert_platform_account(
-                    platform="facebook",
-                    page_id=page["id"],
-                    access_token=page["access_token"],
-                    display_name=page["name"]
-                )
+            upsert_many("facebook", [
+                (page["id"], page["access_token"], page["name"])
+                for page in pages_data.get("data", [])
+            ])
             print("✅ Successfully saved to database!")
         else:
             print("💾 Saving to file...")
@@ -135,19 +127,43 @@ def main():
     print("=" * 40)
     print(f"📊 Storage mode: {'Database' if USE_DATABASE else 'File-based'}")
     
+    # Imported here so the banner prints before the Graph API modules load
+    from app.platforms.facebook import get_user_pages, fetch_token_bootstrap
+    
+    # Reuse page tokens from a previous run while they are still valid
+    pages_data = load_cached_pages()
+    if pages_data:
+        print("🔑 Using cached page tokens from a previous run...")
+        print(f"📊 Found {len(pages_data['data'])} page(s):")
+        print("\n".join(
+            f"   {i}. {page['name']} (ID: {page['id']})" for i, page in enumerate(pages_data['data'], 1)
+        ))
+        
+        if process_pages(pages_data):
+            print("\n🎉 Token processing complete!")
+            return
+    
     # Check if we already have a token in environment
     if FACEBOOK_ACCESS_TOKEN:
         print("🔑 Using existing access token from environment...")
         try:
-            pages_data = get_user_pages(FACEBOOK_ACCESS_TOKEN)
+            me, pages_data = fetch_token_bootstrap(FACEBOOK_ACCESS_TOKEN)
+            
+            # Pages managed through a business portfolio aren't listed by me/accounts
+            if me is not None and not pages_data.get('data'):
+                pages_data = get_user_pages(FACEBOOK_ACCESS_TOKEN)
             
-            if not pages_data.get('data'):
+            if me is None:
+                print("❌ Existing access token is invalid or expired.")
+                print("💡 Let's get a new one...")
+            elif not pages_data.get('data'):
                 print("❌ No Facebook pages found with existing token.")
                 print("💡 The token may be expired. Let's get a new one...")
             else:
                 print(f"📊 Found {len(pages_data['data'])} page(s):")
-                for i, page in enumerate(pages_data['data']):
-                    print(f"   {i+1}. {page['name']} (ID: {page['id']})")
+                print("\n".join(
+                    f"   {i}. {page['name']} (ID: {page['id']})" for i, page in enumerate(pages_data['data'], 1)
+                ))
                 
                 if process_pages(pages_data):
                     print("\n🎉 Token processing complete!")
@@ -159,6 +175,8 @@ def main():
     
     # Interactive token fetching
     try:
+        from app.auth.facebook_auth import get_facebook_login_url, fetch_facebook_token
+        
         # Step 1: Get and display the login URL
         print("\n📱 Step 1: Getting authentication URL...")
         auth_url = get_facebook_login_url()
@@ -195,8 +213,9 @@ def main():
         
         # Step 5: Display pages
         print(f"\n📊 Found {len(pages_data['data'])} page(s):")
-        for i, page in enumerate(pages_data['data']):
-            print(f"   {i+1}. {page['name']} (ID: {page['id']})")
+        print("\n".join(
+            f"   {i}. {page['name']} (ID: {page['id']})" for i, page in enumerate(pages_data['data'], 1)
+        ))
         
         # Step 6: Process and save the tokens
         print(f"\n💾 Step 4: Saving page tokens ({'to database' if USE_DATABASE else 'to file'})...")
@@ -9,51 +9,25 @@ Usage:
     python scripts/instagram_setup.py
 """
 
-import json
 import os
 import sys
 from pathlib import Path
 
+import orjson
+
 # Add the parent directory to the path to import app modules
 project_root = str(Path(__file__).parent.parent)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from app.auth.instagram_auth import get_instagram_login_url, fetch_instagram_token
-from app.platforms.instagram import get_instagram_business_account
-from app.config import USE_DATABASE, INSTAGRAM_ACCESS_TOKEN
+# Directory token files are saved to in file-based storage mode
+SECURE_DIR = Path(__file__).resolve().parent.parent / "app" / "secure"
 
-if USE_DATABASE:
-    from app.db.database import execute_query
+from app.config import USE_DATABASE, INSTAGRAM_ACCESS_TOKEN
 
-def upsert_platform_account(platform, page_id, access_token, display_name):
-    """
-    Insert or update platform account in database.
-    
-    Args:
-        platform (str): Platform name (e.g., 'instagram')
-        page_id (str): Platform-specific page/account ID
-        access_token (str): Access token for the account
-        display_name (str): Human-readable name for the account
-    """
-    query_check = "SELECT id FROM platform_accounts WHERE page_id = %s AND platform = %s"
-    existing = execute_query(query_check, (page_id, platform), fetch=True)
-
-    if existing:
-        query_update = """
-            UPDATE platform_accounts
-            SET access_token = %s, display_name = %s
-            WHERE id = %s
-        """
-        execute_query(query_update, (access_token, display_name, existing[0]['id']))
-        print(f"✅ Updated token for account: {display_name}")
-    else:
-        query_insert = """
-            INSERT INTO platform_accounts (platform, page_id, access_token, display_name)
-            VALUES (%s, %s, %s, %s)
-        """
-        execute_query(query_insert, (platform, page_id, access_token, display_name))
-        print(f"✅ Inserted new platform account: {display_name}")
+def _dump_json(obj, path: Path):
+    """Write obj to path as indented JSON in one write."""
+    path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
 
 def save_instagram_token(data: dict) -> bool:
     """
@@ -66,12 +40,9 @@ def save_instagram_token(data: dict) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        secure_dir = Path(__file__).parent.parent / "app" / "secure"
-        secure_dir.mkdir(exist_ok=True)
-
-        token_file = secure_dir / "instagram_token.json"
-        with open(token_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        SECURE_DIR.mkdir(parents=True, exist_ok=True)
+        token_file = SECURE_DIR / "instagram_token.json"
+        _dump_json(data, token_file)
 
         print(f"✅ Instagram tokens saved to: {token_file}")
         return True
@@ -80,6 +51,30 @@ def save_instagram_token(data: dict) -> bool:
         print(f"❌ Error saving Instagram tokens: {e}")
         return False
 
+def load_cached_token():
+    """
+    Load the Instagram token saved by a previous run if it is still valid.
+    
+    Returns:
+        dict or None: Cached token data, or None if missing or no longer valid
+    """
+    token_file = SECURE_DIR / "instagram_token.json"
+    if not token_file.exists():
+        return None
+    
+    from app.platforms.instagram import validate_instagram_token
+    
+    try:
+        data = orjson.loads(token_file.read_bytes())
+        access_token = data.get("access_token")
+        ig_user_id = data.get("ig_user_id")
+        if access_token and ig_user_id and validate_instagram_token(access_token, ig_user_id):
+            return data
+    except Exception as e:
+        print(f"⚠️  Could not read cached token: {e}")
+    
+    return None
+
 def main():
     """Main function to handle Instagram authentication and token fetching."""
     
@@ -87,6 +82,30 @@ def main():
     print("=" * 40)
     print(f"📊 Storage mode: {'Database' if USE_DATABASE else 'File-based'}")
 
+    # Imported here so the banner prints before the Graph API modules load
+    from app.platforms.instagram import get_instagram_business_account
+
+    # Reuse the token from a previous run while it is still valid
+    cached = load_cached_token()
+    if cached:
+        ig_username = cached.get('username', 'Instagram Account')
+        print("🔑 Using cached access token from a previous run...")
+        print(f"📊 Found Instagram Business Account: {ig_username} (ID: {cached['ig_user_id']})")
+        
+        try:
+            if USE_DATABASE:
+                from app.db.platform_accounts import upsert_many
+                upsert_many("instagram", [(cached['ig_user_id'], cached['access_token'], ig_username)])
+
+            print("\n🎉 Setup complete!")
+            return
+
+        except Exception as e:
+            # Fall through to the environment token and the interactive flow
+            print(f"❌ Error saving to database: {e}")
+            print("💡 Hint: Make sure your database tables are created")
+            print("   You can find the SQL script in app/db/mysql_create_tables.sql")
+
     # Check if we already have a token in environment
     if INSTAGRAM_ACCESS_TOKEN:
         print("🔑 Using existing access token from environment...")
@@ -104,12 +123,8 @@ def main():
                 
                 # Save the credentials
                 if USE_DATABASE:
-                    upsert_platform_account(
-                        platform="instagram",
-                        page_id=ig_user_id,
-                        access_token=access_token,
-                        display_name=ig_username
-                    )
+                    from app.db.platform_accounts import upsert_many
+                    upsert_many("instagram", [(ig_user_id, access_token, ig_username)])
                 else:
                     save_instagram_token({
                         "access_token": access_token,
@@ -126,6 +141,8 @@ def main():
 
     # Interactive token fetching
     try:
+        from app.auth.instagram_auth import get_instagram_login_url, fetch_instagram_token
+        
         # Step 1: Get and display the login URL
         print("\n📱 Step 1: Getting authentication URL...")
         auth_url = get_instagram_login_url()
@@ -186,12 +203,8 @@ def main():
         print(f"\n💾 Step 4: Saving account credentials ({'to database' if USE_DATABASE else 'to file'})...")
         
         if USE_DATABASE:
-            upsert_platform_account(
-                platform="instagram",
-                page_id=ig_user_id,
-                access_token=page_token,  # Use page token for Instagram API calls
-                display_name=ig_username
-            )
+            from app.db.platform_accounts import upsert_many
+            upsert_many("instagram", [(ig_user_id, page_token, ig_username)])  # Use page token for Instagram API calls
         else:
             success = save_instagram_token({
                 "access_token": page_token,  # Use page token for Instagram API calls
@@ -14,34 +14,63 @@ Requirements:
     - Valid redirect URI configured in Pinterest app settings
 """
 
+import hmac
 import sys
 import os
 import webbrowser
 import time
 import json
-from urllib.parse import urlparse, parse_qs
 
 # Add the project root to path for imports
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from app.auth.pinterest_auth import (
-    generate_pinterest_auth_url, exchange_code_for_tokens, 
-    get_user_info, get_user_boards, save_pinterest_credentials
-)
-from app.platforms.pinterest import get_pinterest_boards_info
+# Directory the credentials file is saved to in file-based storage mode
+SECURE_DIR = os.path.join(project_root, "app", "secure")
+
 from app.config import PINTEREST_CLIENT_ID, PINTEREST_CLIENT_SECRET, PINTEREST_REDIRECT_URI
+from _oauth_runner import extract_callback_params
+
+HEADER_TEXT = f"""{"=" * 60}
+🎨 PINTEREST OAUTH2 SETUP
+{"=" * 60}
+
+This script will help you authenticate with Pinterest and
+set up your account for posting to Pinterest boards.
+"""
+
+NEXT_STEPS_TEXT = f"""
+{"=" * 60}
+🎉 PINTEREST SETUP COMPLETE!
+{"=" * 60}
+
+✅ Your Pinterest account is now connected and ready to use!
+
+📋 Next Steps:
+1. Run the main application:
+   python main.py
+
+2. In the dashboard:
+   - Select 'Pinterest' as one of your platforms
+   - Create your content with media (images work best)
+   - Post to your Pinterest boards!
+
+💡 Tips:
+   - Pinterest works best with vertical images (2:3 ratio)
+   - Use engaging titles and descriptions
+   - Include relevant keywords for discoverability
+   - Pins will be posted to your default board
+
+🔧 Troubleshooting:
+   - If posting fails, re-run this setup script
+   - Check that your Pinterest app has the correct permissions
+   - Ensure your boards are public or accessible
+"""
 
 def print_header():
     """Print the setup script header."""
-    print("=" * 60)
-    print("🎨 PINTEREST OAUTH2 SETUP")
-    print("=" * 60)
-    print()
-    print("This script will help you authenticate with Pinterest and")
-    print("set up your account for posting to Pinterest boards.")
-    print()
+    print(HEADER_TEXT)
 
 def validate_config():
     """Validate Pinterest configuration."""
@@ -78,11 +107,59 @@ def validate_config():
     print()
     return True
 
+def load_cached_credentials():
+    """
+    Reuse Pinterest credentials saved by a previous run.
+    
+    A stored token that no longer validates is refreshed with its refresh
+    token, so the interactive flow is only needed when both have expired.
+    
+    Returns:
+        bool: True if usable credentials are stored, False otherwise
+    """
+    token_file = os.path.join(SECURE_DIR, "pinterest_token.json")
+    if not os.path.exists(token_file):
+        return False
+    
+    from app.auth.pinterest_auth import (
+        refresh_access_token, save_pinterest_credentials, validate_access_token
+    )
+    
+    try:
+        with open(token_file) as f:
+            credentials = json.load(f)
+        
+        access_token = credentials.get("access_token")
+        if access_token and validate_access_token(access_token):
+            print("✅ Existing Pinterest credentials are still valid")
+            print(f"   Username: @{credentials.get('username', '')}")
+            return True
+        
+        refresh_token = credentials.get("refresh_token")
+        if not refresh_token:
+            return False
+        
+        print("🔄 Stored access token has expired, refreshing...")
+        token_data = refresh_access_token(refresh_token)
+        credentials["access_token"] = token_data["access_token"]
+        credentials["refresh_token"] = token_data.get("refresh_token", refresh_token)
+        
+        if save_pinterest_credentials(credentials):
+            print("✅ Pinterest access token refreshed!")
+            return True
+        
+    except Exception as e:
+        print(f"⚠️  Could not reuse stored credentials: {e}")
+    
+    return False
+
 def get_authorization_code():
     """Handle the OAuth2 authorization flow."""
     print("🔐 Starting Pinterest OAuth2 authorization...")
     print()
     
+    from app.auth.pinterest_auth import generate_pinterest_auth_url
+    
     # Generate authorization URL
     auth_url, state = generate_pinterest_auth_url()
     
@@ -118,33 +195,23 @@ def get_authorization_code():
             print("❌ Please provide the callback URL")
             continue
         
-        # Parse the callback URL
-        try:
-            parsed_url = urlparse(callback_url)
-            query_params = parse_qs(parsed_url.query)
-            
-            if 'code' not in query_params:
-                print("❌ No authorization code found in URL")
-                print("   Make sure you copied the complete URL after authorization")
-                continue
-            
-            auth_code = query_params['code'][0]
-            
-            # Verify state parameter if present
-            if 'state' in query_params:
-                received_state = query_params['state'][0]
-                if received_state != state:
-                    print("⚠️  State parameter mismatch - this might be a security issue")
-                    choice = input("Continue anyway? (y/N): ").strip().lower()
-                    if choice != 'y':
-                        continue
-            
-            return auth_code
-            
-        except Exception as e:
-            print(f"❌ Error parsing callback URL: {e}")
+        params = extract_callback_params(callback_url, ('code', 'state'))
+        auth_code = params.get('code')
+        if not auth_code:
+            print("❌ No 'code' parameter found in the callback URL")
             print("   Please make sure you copied the complete URL")
             continue
+        
+        # Verify state parameter if present
+        received_state = params.get('state')
+        if received_state is not None:
+            if not hmac.compare_digest(received_state.encode(), state.encode()):
+                print("⚠️  State parameter mismatch - this might be a security issue")
+                choice = input("Continue anyway? (y/N): ").strip().lower()
+                if choice != 'y':
+                    continue
+        
+        return auth_code
 
 def exchange_tokens(auth_code):
     """Exchange authorization code for access tokens."""
@@ -152,6 +219,8 @@ def exchange_tokens(auth_code):
     print("🔄 Exchanging authorization code for access tokens...")
     
     try:
+        from app.auth.pinterest_auth import exchange_code_for_tokens
+        
         token_data = exchange_code_for_tokens(auth_code)
         
         access_token = token_data.get("access_token")
@@ -179,6 +248,8 @@ def get_account_info(access_token):
     print("👤 Fetching Pinterest account information...")
     
     try:
+        from app.auth.pinterest_auth import get_user_info, get_user_boards
+        
         # Get user info
         user_info = get_user_info(access_token)
         
@@ -196,30 +267,33 @@ def get_account_info(access_token):
         print()
         print("📌 Fetching Pinterest boards...")
         
+        # Only the first page of boards is stored; the dashboard fetches the
+        # full list from the API when it needs it
         try:
-            boards_data = get_user_boards(access_token)
-            boards = boards_data.get("items", [])
+            boards_data = get_user_boards(access_token, page_size=25)
+            boards = boards_data.get("items", [])[:25]
             
             print(f"✅ Found {len(boards)} board(s):")
-            for i, board in enumerate(boards[:5], 1):  # Show first 5 boards
-                board_name = board.get("name", "Untitled")
-                pin_count = board.get("pin_count", 0)
-                privacy = board.get("privacy", "unknown")
-                print(f"   {i}. {board_name} ({pin_count} pins, {privacy})")
             
-            if len(boards) > 5:
-                print(f"   ... and {len(boards) - 5} more boards")
-            
-            # Format boards for storage
+            # Format boards for storage, collecting a preview of the first 5
             boards_info = []
-            for board in boards:
-                boards_info.append({
+            preview = []
+            for i, board in enumerate(boards, 1):
+                entry = {
                     "id": board.get("id", ""),
                     "name": board.get("name", ""),
                     "description": board.get("description", ""),
                     "pin_count": board.get("pin_count", 0),
                     "privacy": board.get("privacy", "public")
-                })
+                }
+                boards_info.append(entry)
+                if i <= 5:
+                    preview.append(f"   {i}. {entry['name'] or 'Untitled'} ({entry['pin_count']} pins, {entry['privacy']})")
+            
+            if len(boards) > 5:
+                preview.append(f"   ... and {len(boards) - 5} more boards")
+            if preview:
+                print("\n".join(preview))
             
         except Exception as e:
             print(f"⚠️  Could not fetch boards: {e}")
@@ -243,14 +317,16 @@ def save_credentials(token_data, account_info):
     print("💾 Saving Pinterest credentials...")
     
     try:
+        from app.auth.pinterest_auth import save_pinterest_credentials
+        
         # Combine token data and account info
         credentials = {
-            "access_token": token_data.get("access_token"),
+            "access_token": token_data["access_token"],
             "refresh_token": token_data.get("refresh_token"),
             "token_type": token_data.get("token_type", "Bearer"),
-            "scope": token_data.get("scope", ""),
-            **account_info
+            "scope": token_data.get("scope", "")
         }
+        credentials.update(account_info)
         
         # Save credentials
         success = save_pinterest_credentials(credentials)
@@ -294,33 +370,7 @@ def test_connection():
 
 def print_next_steps():
     """Print next steps for the user."""
-    print()
-    print("=" * 60)
-    print("🎉 PINTEREST SETUP COMPLETE!")
-    print("=" * 60)
-    print()
-    print("✅ Your Pinterest account is now connected and ready to use!")
-    print()
-    print("📋 Next Steps:")
-    print("1. Run the main application:")
-    print("   python main.py")
-    print()
-    print("2. In the dashboard:")
-    print("   - Select 'Pinterest' as one of your platforms")
-    print("   - Create your content with media (images work best)")
-    print("   - Post to your Pinterest boards!")
-    print()
-    print("💡 Tips:")
-    print("   - Pinterest works best with vertical images (2:3 ratio)")
-    print("   - Use engaging titles and descriptions")
-    print("   - Include relevant keywords for discoverability")
-    print("   - Pins will be posted to your default board")
-    print()
-    print("🔧 Troubleshooting:")
-    print("   - If posting fails, re-run this setup script")
-    print("   - Check that your Pinterest app has the correct permissions")
-    print("   - Ensure your boards are public or accessible")
-    print()
+    print(NEXT_STEPS_TEXT)
 
 def main():
     """Main setup function."""
@@ -331,6 +381,12 @@ def main():
         if not validate_config():
             return
         
+        # Skip the browser flow when stored credentials still work
+        if load_cached_credentials():
+            test_connection()
+            print_next_steps()
+            return
+        
         # Get authorization code
         auth_code = get_authorization_code()
         if not auth_code:
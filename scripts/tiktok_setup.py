@@ -9,9 +9,10 @@ Usage:
     python scripts/tiktok_setup.py
 """
 
-import json
 import os
 import sys
+import tempfile
+import time
 from pathlib import Path
 
 # Add the parent directory to the path to import app modules
@@ -19,41 +20,13 @@ project_root = str(Path(__file__).parent.parent)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from app.auth.tiktok_auth import get_tiktok_login_url, fetch_tiktok_token
-from app.platforms.tiktok import get_user_info
-from app.config import USE_DATABASE, TIKTOK_ACCESS_TOKEN
+from app.config import USE_DATABASE, TIKTOK_ACCESS_TOKEN, TIKTOK_CLIENT_ID
+from _oauth_runner import ProviderSpec, extract_callback_params, run_oauth_setup
 
-if USE_DATABASE:
-    from app.db.database import execute_query
+TOKEN_FILE = Path(__file__).parent.parent / "app" / "secure" / "tiktok_token.json"
 
-def upsert_platform_account(platform, page_id, access_token, display_name):
-    """
-    Insert or update platform account in database.
-    
-    Args:
-        platform (str): Platform name (e.g., 'tiktok')
-        page_id (str): Platform-specific page/account ID
-        access_token (str): Access token for the account
-        display_name (str): Human-readable name for the account
-    """
-    query_check = "SELECT id FROM platform_accounts WHERE page_id = %s AND platform = %s"
-    existing = execute_query(query_check, (page_id, platform), fetch=True)
-
-    if existing:
-        query_update = """
-            UPDATE platform_accounts
-            SET access_token = %s, display_name = %s
-            WHERE id = %s
-        """
-        execute_query(query_update, (access_token, display_name, existing[0]['id']))
-        print(f"✅ Updated token for account: {display_name}")
-    else:
-        query_insert = """
-            INSERT INTO platform_accounts (platform, page_id, access_token, display_name)
-            VALUES (%s, %s, %s, %s)
-        """
-        execute_query(query_insert, (platform, page_id, access_token, display_name))
-        print(f"✅ Inserted new platform account: {display_name}")
+# Refresh the saved token this many seconds before it expires
+REFRESH_MARGIN = 300
 
 def save_tiktok_token(data: dict) -> bool:
     """
@@ -65,149 +38,264 @@ def save_tiktok_token(data: dict) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
+    from app.auth.crypto import dump_credentials
+    
     try:
-        secure_dir = Path(__file__).parent.parent / "app" / "secure"
-        secure_dir.mkdir(exist_ok=True)
+        TOKEN_FILE.parent.mkdir(exist_ok=True)
 
-        token_file = secure_dir / "tiktok_token.json"
-        with open(token_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Write a temp file and rename it over the token file, so an interrupted
+        # save leaves the previous token in place rather than a truncated file
+        with tempfile.NamedTemporaryFile(dir=TOKEN_FILE.parent, suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+        try:
+            with open(tmp_path, 'wb') as f:
+                # Compact JSON: the file is read by the app, not by people
+                f.write(dump_credentials(data, separators=(",", ":")))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, TOKEN_FILE)
+        except BaseException:
+            # Never leave a stray temp file next to the token
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
-        print(f"✅ TikTok tokens saved to: {token_file}")
+        print(f"✅ TikTok tokens saved to: {TOKEN_FILE}")
         return True
 
     except Exception as e:
         print(f"❌ Error saving TikTok tokens: {e}")
         return False
 
-def main():
-    """Main function to handle TikTok authentication and token fetching."""
+def load_existing_tiktok_credentials():
+    """
+    Load the stored TikTok account from the database or the token file.
     
-    print("🔗 TikTok Token Setup")
-    print("=" * 40)
-    print(f"📊 Storage mode: {'Database' if USE_DATABASE else 'File-based'}")
-
-    # Check if we already have a token in environment
-    if TIKTOK_ACCESS_TOKEN:
-        print("🔑 Using existing access token from environment...")
-        access_token = TIKTOK_ACCESS_TOKEN
-        try:
-            user_info = get_user_info(access_token)
-            open_id = user_info.get('open_id')
-            display_name = user_info.get('display_name', 'TikTok User')
-
-            if not open_id:
-                print("❌ Failed to retrieve TikTok user information with existing token.")
-                print("💡 The token may be expired. Let's get a new one...")
-            else:
-                print(f"📊 Found TikTok User: {display_name} (ID: {open_id})")
-                
-                # Save the credentials
-                if USE_DATABASE:
-                    upsert_platform_account(
-                        platform="tiktok",
-                        page_id=open_id,
-                        access_token=access_token,
-                        display_name=display_name
-                    )
-                else:
-                    save_tiktok_token({
-                        "access_token": access_token,
-                        "open_id": open_id,
-                        "display_name": display_name
-                    })
-                
-                print("\n🎉 Setup complete!")
-                return
-                
-        except Exception as e:
-            print(f"❌ Error with existing token: {e}")
-            print("💡 Let's get a fresh token...")
-
-    # Interactive token fetching
-    try:
-        # Step 1: Get and display the login URL
-        print("\n📱 Step 1: Getting authentication URL...")
-        auth_url = get_tiktok_login_url()
-        print("\n🌐 Please go to this URL and log in to TikTok:")
-        print(f"   {auth_url}")
-        print("\n📋 After logging in, you'll be redirected to a URL starting with your redirect URI.")
-        print("   Copy that ENTIRE URL and paste it below.\n")
-        
-        # Step 2: Get the redirect response from user
-        redirect_response = input("📥 Paste the full redirect URL here: ").strip()
-        
-        if not redirect_response:
-            print("❌ No URL provided. Exiting.")
-            return
-        
-        # Step 3: Fetch the access token
-        print("\n🔑 Step 2: Fetching access token...")
-        token_data = fetch_tiktok_token(redirect_response)
-        
-        access_token = token_data.get('access_token')
-        
-        if not access_token:
-            print("❌ Failed to get access token")
-            print(f"Response: {token_data}")
-            return
-            
-        print("✅ Access token obtained")
+    Returns:
+        dict: Stored credentials with at least access_token, or None if none are saved
+    """
+    if USE_DATABASE:
+        from app.db.database import execute_query
         
-        # Step 4: Get user info
-        print("\n📄 Step 3: Fetching TikTok user information...")
-        user_info = get_user_info(access_token)
+        rows = execute_query(
+            "SELECT page_id, access_token, display_name FROM platform_accounts WHERE platform = 'tiktok' LIMIT 1",
+            fetch=True,
+            dictionary=True
+        )
+        return rows[0] if rows else None
+
+    if not TOKEN_FILE.exists():
+        return None
+
+    from app.auth.crypto import load_credentials
+    
+    return load_credentials(TOKEN_FILE.read_bytes())
+
+def _token_expiring(data: dict) -> bool:
+    """Whether a saved token is known to expire within REFRESH_MARGIN seconds."""
+    obtained_at = data.get('obtained_at')
+    expires_in = data.get('expires_in')
+    return bool(obtained_at and expires_in) and time.time() >= obtained_at + expires_in - REFRESH_MARGIN
+
+def refresh_saved_token(data: dict) -> bool:
+    """
+    Exchange the saved refresh token for a new access token and save it.
+    
+    Only used with file-based storage, since the database does not keep the
+    refresh token.
+    
+    Args:
+        data (dict): Credentials loaded from the token file
         
+    Returns:
+        bool: True if the token was refreshed and saved
+    """
+    from app.auth.tiktok_auth import refresh_tiktok_token
+    
+    refresh_token = data.get('refresh_token')
+    if not refresh_token:
+        return False
+
+    try:
+        print("🔄 Saved access token is expiring, refreshing...")
+        token_data = refresh_tiktok_token(refresh_token)
+        data.update({
+            "access_token": token_data['access_token'],
+            "refresh_token": token_data.get('refresh_token', refresh_token),
+            "expires_in": token_data.get('expires_in'),
+            "obtained_at": time.time()
+        })
+        return save_tiktok_token(data)
+
+    except Exception as e:
+        print(f"⚠️  Could not refresh saved token: {e}")
+        return False
+
+def reuse_existing_token() -> bool:
+    """
+    Use stored credentials or TIKTOK_ACCESS_TOKEN instead of logging in again.
+    
+    Runs before the OAuth client settings are checked, so an install with a
+    working stored token needs none of them. Stored credentials are probed
+    against /user/info, and refreshed first (file storage only) when they are
+    about to expire.
+    
+    Returns:
+        bool: True if an existing token was found and is usable
+    """
+    from app.platforms.tiktok import get_user_info
+
+    try:
+        stored = load_existing_tiktok_credentials()
+    except Exception as e:
+        print(f"⚠️  Could not read saved credentials: {e}")
+        stored = None
+
+    if stored and stored.get('access_token'):
+        if not _token_expiring(stored):
+            try:
+                user_info = get_user_info(stored['access_token'])
+                if user_info.get('open_id'):
+                    print(f"✅ TikTok is already set up for {user_info.get('display_name', 'TikTok User')}")
+                    return True
+            except Exception as e:
+                print(f"⚠️  Saved access token was rejected: {e}")
+
+        # Refresh the saved token instead of repeating the browser flow; the
+        # refresh request needs the client key
+        if not USE_DATABASE and TIKTOK_CLIENT_ID and refresh_saved_token(stored):
+            return True
+
+    if not TIKTOK_ACCESS_TOKEN:
+        return False
+
+    print("🔑 Using existing access token from environment...")
+    try:
+        user_info = get_user_info(TIKTOK_ACCESS_TOKEN)
         open_id = user_info.get('open_id')
         display_name = user_info.get('display_name', 'TikTok User')
-        
+
         if not open_id:
-            print("❌ Failed to retrieve TikTok user information.")
-            print(f"Response: {user_info}")
-            return
-        
-        # Step 5: Display user info
-        print(f"\n📊 Found TikTok User:")
-        print(f"   Display Name: {display_name}")
-        print(f"   Open ID: {open_id}")
-        
-        # Step 6: Save the credentials
-        print(f"\n💾 Step 4: Saving account credentials ({'to database' if USE_DATABASE else 'to file'})...")
-        
-        if USE_DATABASE:
-            upsert_platform_account(
-                platform="tiktok",
-                page_id=open_id,
-                access_token=access_token,
-                display_name=display_name
-            )
-        else:
-            success = save_tiktok_token({
-                "access_token": access_token,
-                "open_id": open_id,
-                "display_name": display_name
-            })
-            if not success:
-                print("❌ Failed to save token to file")
-                return
-        
-        print("\n🎉 Setup complete! You can now post to TikTok via the dashboard.")
-        print("\n💡 Next steps:")
-        print("   1. Run the dashboard: python main.py")
-        print("   2. Select TikTok as your platform")
-        print("   3. Upload videos and start posting!")
-        print("\n⚠️  Important notes:")
-        print("   - TikTok primarily supports video content")
-        print("   - Rate limits: 2 videos per minute, 20 videos per day")
-        print("   - Videos must be in MP4 format")
-        
+            print("❌ Failed to retrieve TikTok user information with existing token.")
+            print("💡 The token may be expired. Let's get a new one...")
+            return False
+
+        print(f"📊 Found TikTok User: {display_name} (ID: {open_id})")
+        return save_account({'access_token': TIKTOK_ACCESS_TOKEN}, user_info)
+
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        print(f"❌ Error with existing token: {e}")
+        print("💡 Let's get a fresh token...")
+        return False
+
+def build_auth_url():
+    """Build the TikTok login URL; the exchange needs nothing else from this step."""
+    from app.auth.tiktok_auth import get_tiktok_login_url
+    
+    return get_tiktok_login_url(), None
+
+def parse_callback(redirect_response, flow):
+    """Check the redirect URL carries an authorization code; the exchange parses it."""
+    if 'code' not in extract_callback_params(redirect_response, ('code',)):
+        raise ValueError("No authorization code found in redirect URL")
+    return redirect_response
+
+def exchange_token(redirect_response, flow):
+    """Exchange the redirect URL for an access token."""
+    from app.auth.tiktok_auth import fetch_tiktok_token
+    
+    print("\n🔑 Fetching access token...")
+    token_data = fetch_tiktok_token(redirect_response)
+
+    if not token_data.get('access_token'):
+        print("❌ Failed to get access token")
+        print(f"Response: {token_data}")
+        return None
+
+    print("✅ Access token obtained")
+    return token_data
+
+def get_account_info(token_data):
+    """Fetch and display the TikTok user for the access token."""
+    from app.platforms.tiktok import get_user_info
+    
+    print("\n📄 Fetching TikTok user information...")
+    user_info = get_user_info(token_data['access_token'])
+
+    if not user_info.get('open_id'):
+        print("❌ Failed to retrieve TikTok user information.")
+        print(f"Response: {user_info}")
+        return None
+
+    print("\n📊 Found TikTok User:")
+    print(f"   Display Name: {user_info.get('display_name', 'TikTok User')}")
+    print(f"   Open ID: {user_info['open_id']}")
+    return user_info
+
+def save_account(token_data, user_info):
+    """Save the account to the database or the token file."""
+    print(f"\n💾 Saving account credentials ({'to database' if USE_DATABASE else 'to file'})...")
+
+    access_token = token_data['access_token']
+    open_id = user_info['open_id']
+    display_name = user_info.get('display_name', 'TikTok User')
+
+    if USE_DATABASE:
+        from app.db.platform_accounts import upsert_many
+        upsert_many("tiktok", [(open_id, access_token, display_name)])
+        return True
+
+    if not save_tiktok_token({
+        "access_token": access_token,
+        "open_id": open_id,
+        "display_name": display_name,
+        "refresh_token": token_data.get('refresh_token'),
+        "expires_in": token_data.get('expires_in'),
+        "obtained_at": time.time()
+    }):
+        print("❌ Failed to save token to file")
+        return False
+    return True
+
+TIKTOK_SPEC = ProviderSpec(
+    name="TikTok",
+    required_env=("TIKTOK_CLIENT_ID", "TIKTOK_CLIENT_SECRET", "TIKTOK_REDIRECT_URI"),
+    env_help="📝 Please add these to your .env file from your TikTok developer app.",
+    redirect_env="TIKTOK_REDIRECT_URI",
+    build_auth_url=build_auth_url,
+    parse_callback=parse_callback,
+    exchange=exchange_token,
+    userinfo=get_account_info,
+    save=save_account,
+    reuse_saved=reuse_existing_token
+)
+
+def main():
+    """Main function to handle TikTok authentication and token fetching."""
+    
+    print("🔗 TikTok Token Setup")
+    print("=" * 40)
+    print(f"📊 Storage mode: {'Database' if USE_DATABASE else 'File-based'}")
+
+    if not run_oauth_setup(TIKTOK_SPEC):
         print("\n💡 Troubleshooting:")
         print("   - Make sure your TikTok app credentials are correct in .env")
         print("   - Verify your redirect URI matches exactly")
         print("   - Check that your app has the required scopes enabled")
         print("   - For business accounts, ensure you have the Content Posting API enabled")
+        return
+
+    print("\n🎉 Setup complete! You can now post to TikTok via the dashboard.")
+    print("\n💡 Next steps:")
+    print("   1. Run the dashboard: python main.py")
+    print("   2. Select TikTok as your platform")
+    print("   3. Upload videos and start posting!")
+    print("\n⚠️  Important notes:")
+    print("   - TikTok primarily supports video content")
+    print("   - Rate limits: 2 videos per minute, 20 videos per day")
+    print("   - Videos must be in MP4 format")
 
 if __name__ == "__main__":
     main()
@@ -8,208 +8,154 @@ and saves the credentials for use in the social media scheduler.
 
 import os
 import sys
-import webbrowser
-from urllib.parse import parse_qs, urlparse
 
 # Add the parent directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.auth.tumblr_auth import (
-    generate_tumblr_auth_url,
-    exchange_code_for_tokens,
-    get_user_info,
-    save_tumblr_credentials,
-    validate_access_token
-)
-from app.platforms.tumblr import test_tumblr_connection
+from _oauth_runner import ProviderSpec, extract_callback_params, run_oauth_setup
+
+def build_auth_url():
+    """Request a token and build the authorization URL for it."""
+    from app.auth.tumblr_auth import generate_tumblr_auth_url
+    
+    auth_data = generate_tumblr_auth_url()
+    
+    if not auth_data or 'auth_url' not in auth_data:
+        print("   Please check your TUMBLR_CLIENT_ID and TUMBLR_CLIENT_SECRET")
+        return None, None
+    
+    print(f"✅ Authorization URL generated")
+    print(f"   The callback URL will contain 'oauth_token' and 'oauth_verifier' parameters")
+    return auth_data['auth_url'], auth_data
+
+
+def parse_callback(callback_url, auth_data):
+    """Extract the OAuth verifier from the callback URL."""
+    params = extract_callback_params(callback_url, ('oauth_token', 'oauth_verifier'))
+    
+    oauth_verifier = params.get('oauth_verifier')
+    if not oauth_verifier:
+        raise ValueError("oauth_verifier not found in URL")
+    
+    if params.get('oauth_token') != auth_data['oauth_token']:
+        raise ValueError("oauth_token mismatch")
+    
+    return oauth_verifier
+
+
+def exchange_tokens(oauth_verifier, auth_data):
+    """Exchange the verifier for access tokens."""
+    from app.auth.tumblr_auth import exchange_code_for_tokens
+    
+    print(f"\n🔄 Exchanging for access tokens...")
+    
+    token_data = exchange_code_for_tokens(
+        auth_data['oauth_token'],
+        auth_data['oauth_token_secret'],
+        oauth_verifier
+    )
+    
+    if not token_data or not token_data.get('success'):
+        error_msg = token_data.get('error', 'Unknown error') if token_data else 'No response'
+        print(f"❌ Failed to exchange tokens: {error_msg}")
+        return None
+    
+    print("✅ Access tokens obtained")
+    return token_data
+
 
-def check_environment():
-    """Check if required environment variables are set."""
-    required_vars = [
-        'TUMBLR_CLIENT_ID',
-        'TUMBLR_CLIENT_SECRET',
-        'TUMBLR_REDIRECT_URI'
-    ]
+def get_account_info(token_data):
+    """Get user info, which also proves the tokens are valid."""
+    from app.auth.tumblr_auth import get_user_info
     
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    print(f"\n👤 Getting user information (this also validates the access tokens)...")
     
-    if missing_vars:
-        print("❌ Missing required environment variables:")
-        for var in missing_vars:
-            print(f"   - {var}")
-        print("\n📝 Please add these to your .env file:")
-        print("   TUMBLR_CLIENT_ID=your_consumer_key")
-        print("   TUMBLR_CLIENT_SECRET=your_consumer_secret")
-        print("   TUMBLR_REDIRECT_URI=your_callback_url")
-        print("\n🔗 Get your Tumblr app credentials at: https://www.tumblr.com/oauth/apps")
+    user_info = get_user_info(token_data['access_token'], token_data['access_token_secret'])
+    if not user_info:
+        print("❌ Failed to validate access tokens")
+        return None
+    
+    print(f"✅ Connected to Tumblr successfully!")
+    print(f"   Username: {user_info.get('username', 'Unknown')}")
+    print(f"   Primary Blog: {user_info.get('blog_title', user_info.get('blog_name', 'Unknown'))}")
+    print(f"   Blog URL: {user_info.get('blog_url', 'Unknown')}")
+    print(f"   Total Blogs: {user_info.get('total_blogs', 0)}")
+    print(f"   Followers: {user_info.get('followers', 0)}")
+    print(f"   Posts: {user_info.get('posts', 0)}")
+    return user_info
+
+
+def save_credentials(token_data, user_info):
+    """Save the access tokens with the primary blog details."""
+    from app.auth.tumblr_auth import save_tumblr_credentials
+    
+    print(f"\n💾 Saving credentials...")
+    
+    credentials = {
+        'access_token': token_data['access_token'],
+        'access_token_secret': token_data['access_token_secret'],
+        'username': user_info.get('username'),
+        'blog_name': user_info.get('blog_name'),
+        'blog_title': user_info.get('blog_title'),
+        'blog_url': user_info.get('blog_url')
+    }
+    
+    if save_tumblr_credentials(credentials):
+        print("✅ Credentials saved successfully")
+        return True
+    
+    print("❌ Failed to save credentials")
+    return False
+
+
+def test_connection(user_info):
+    """Test the connection using the saved credentials."""
+    from app.platforms.tumblr import test_tumblr_connection
+    
+    print(f"\n🧪 Testing connection...")
+    
+    test_result = test_tumblr_connection()
+    if test_result.get('success'):
+        print("✅ Connection test successful!")
+        print(f"   {test_result.get('message', '')}")
+    else:
+        print(f"❌ Connection test failed: {test_result.get('error', 'Unknown error')}")
         return False
     
+    # Success message
+    print(f"\n🎉 Tumblr Setup Complete!")
+    print(f"=" * 50)
+    print(f"✅ You can now use Tumblr in your social media scheduler")
+    print(f"✅ Your credentials are saved and ready to use")
+    print(f"✅ You can post to: {user_info.get('blog_title', user_info.get('blog_name', 'your blog'))}")
     return True
 
+
+TUMBLR_SPEC = ProviderSpec(
+    name="Tumblr",
+    required_env=('TUMBLR_CLIENT_ID', 'TUMBLR_CLIENT_SECRET', 'TUMBLR_REDIRECT_URI'),
+    env_help="""📝 Please add these to your .env file:
+   TUMBLR_CLIENT_ID=your_consumer_key
+   TUMBLR_CLIENT_SECRET=your_consumer_secret
+   TUMBLR_REDIRECT_URI=your_callback_url
+
+🔗 Get your Tumblr app credentials at: https://www.tumblr.com/oauth/apps""",
+    redirect_env='TUMBLR_REDIRECT_URI',
+    build_auth_url=build_auth_url,
+    parse_callback=parse_callback,
+    exchange=exchange_tokens,
+    userinfo=get_account_info,
+    save=save_credentials,
+    test=test_connection
+)
+
+
 def setup_tumblr_auth():
     """Main setup function for Tumblr OAuth 1.0a authentication."""
     print("🎨 Tumblr OAuth 1.0a Setup")
     print("=" * 50)
     
-    # Check environment variables
-    if not check_environment():
-        return False
-    
-    print("✅ Environment variables found")
-    
-    # Display current configuration
-    print(f"\n📋 Current Configuration:")
-    print(f"   Consumer Key: {os.getenv('TUMBLR_CLIENT_ID')[:10]}...")
-    print(f"   Consumer Secret: {'*' * 20}")
-    print(f"   Redirect URI: {os.getenv('TUMBLR_REDIRECT_URI')}")
-    
-    try:
-        # Step 1: Generate authorization URL
-        print("\n🔗 Step 1: Getting authorization URL...")
-        auth_data = generate_tumblr_auth_url()
-        
-        if not auth_data or 'auth_url' not in auth_data:
-            print("❌ Failed to generate authorization URL")
-            print("   Please check your TUMBLR_CLIENT_ID and TUMBLR_CLIENT_SECRET")
-            return False
-        
-        auth_url = auth_data['auth_url']
-        oauth_token = auth_data['oauth_token']
-        oauth_token_secret = auth_data['oauth_token_secret']
-        
-        print(f"✅ Authorization URL generated")
-        
-        # Step 2: Open browser for user authorization
-        print(f"\n🌐 Step 2: Opening authorization URL in browser...")
-        print(f"   {auth_url}")
-        
-        try:
-            webbrowser.open(auth_url)
-            print("✅ Browser opened")
-        except Exception as e:
-            print(f"⚠️  Could not open browser automatically: {e}")
-            print("   Please manually open the URL above")
-        
-        # Step 3: Get authorization response
-        print(f"\n🔑 Step 3: After authorizing, you'll be redirected to:")
-        print(f"   {os.getenv('TUMBLR_REDIRECT_URI')}")
-        print(f"\n   The URL will contain 'oauth_token' and 'oauth_verifier' parameters")
-        
-        while True:
-            callback_url = input("\n📝 Please paste the full callback URL here: ").strip()
-            
-            if not callback_url:
-                print("❌ Please provide the callback URL")
-                continue
-            
-            # Parse the callback URL
-            try:
-                parsed_url = urlparse(callback_url)
-                query_params = parse_qs(parsed_url.query)
-                
-                oauth_verifier = query_params.get('oauth_verifier', [None])[0]
-                returned_oauth_token = query_params.get('oauth_token', [None])[0]
-                
-                if not oauth_verifier:
-                    print("❌ oauth_verifier not found in URL. Please try again.")
-                    continue
-                
-                if returned_oauth_token != oauth_token:
-                    print("❌ oauth_token mismatch. Please try again.")
-                    continue
-                
-                break
-                
-            except Exception as e:
-                print(f"❌ Error parsing callback URL: {e}")
-                continue
-        
-        # Step 4: Exchange for access tokens
-        print(f"\n🔄 Step 4: Exchanging for access tokens...")
-        
-        token_data = exchange_code_for_tokens(
-            oauth_token, 
-            oauth_token_secret, 
-            oauth_verifier
-        )
-        
-        if not token_data or not token_data.get('success'):
-            error_msg = token_data.get('error', 'Unknown error') if token_data else 'No response'
-            print(f"❌ Failed to exchange tokens: {error_msg}")
-            return False
-        
-        access_token = token_data['access_token']
-        access_token_secret = token_data['access_token_secret']
-        
-        print("✅ Access tokens obtained")
-        
-        # Step 5: Validate tokens and get user info
-        print(f"\n👤 Step 5: Getting user information...")
-        
-        if not validate_access_token(access_token, access_token_secret):
-            print("❌ Failed to validate access tokens")
-            return False
-        
-        user_info = get_user_info(access_token, access_token_secret)
-        if not user_info:
-            print("❌ Failed to get user information")
-            return False
-        
-        print(f"✅ Connected to Tumblr successfully!")
-        print(f"   Username: {user_info.get('username', 'Unknown')}")
-        print(f"   Primary Blog: {user_info.get('blog_title', user_info.get('blog_name', 'Unknown'))}")
-        print(f"   Blog URL: {user_info.get('blog_url', 'Unknown')}")
-        print(f"   Total Blogs: {user_info.get('total_blogs', 0)}")
-        print(f"   Followers: {user_info.get('followers', 0)}")
-        print(f"   Posts: {user_info.get('posts', 0)}")
-        
-        # Step 6: Save credentials
-        print(f"\n💾 Step 6: Saving credentials...")
-        
-        credentials = {
-            'access_token': access_token,
-            'access_token_secret': access_token_secret,
-            'username': user_info.get('username'),
-            'blog_name': user_info.get('blog_name'),
-            'blog_title': user_info.get('blog_title'),
-            'blog_url': user_info.get('blog_url')
-        }
-        
-        if save_tumblr_credentials(credentials):
-            print("✅ Credentials saved successfully")
-        else:
-            print("❌ Failed to save credentials")
-            return False
-        
-        # Step 7: Test connection
-        print(f"\n🧪 Step 7: Testing connection...")
-        
-        test_result = test_tumblr_connection()
-        if test_result.get('success'):
-            print("✅ Connection test successful!")
-            print(f"   {test_result.get('message', '')}")
-        else:
-            print(f"❌ Connection test failed: {test_result.get('error', 'Unknown error')}")
-            return False
-        
-        # Success message
-        print(f"\n🎉 Tumblr Setup Complete!")
-        print(f"=" * 50)
-        print(f"✅ You can now use Tumblr in your social media scheduler")
-        print(f"✅ Your credentials are saved and ready to use")
-        print(f"✅ You can post to: {user_info.get('blog_title', user_info.get('blog_name', 'your blog'))}")
-        
-        return True
-        
-    except KeyboardInterrupt:
-        print(f"\n\n❌ Setup cancelled by user")
-        return False
-    except Exception as e:
-        print(f"\n❌ Setup failed with error: {e}")
-        return False
+    return run_oauth_setup(TUMBLR_SPEC)
 
 def main():
     """Main entry point."""
@@ -22,18 +22,16 @@ Run this script to:
 import os
 import sys
 import json
-import webbrowser
-from urllib.parse import urlparse, parse_qs
+import time
+from datetime import datetime
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.config import X_CLIENT_ID, X_CLIENT_SECRET, X_REDIRECT_URI
-from app.auth.x_auth import (
-    generate_x_auth_url, exchange_code_for_tokens, get_user_info,
-    save_x_credentials, validate_access_token
-)
-from app.platforms.x import test_x_connection
+from _oauth_runner import ProviderSpec, extract_callback_params, run_oauth_setup
+
+# Refresh saved tokens this many seconds before they expire
+REFRESH_MARGIN = 300
 
 
 def print_header():
@@ -51,110 +49,112 @@ def print_header():
     print()
 
 
-def check_configuration():
-    """Check if required configuration is present."""
-    print("🔍 Checking configuration...")
+def _seconds_remaining(credentials):
+    """Seconds until the saved access token expires, or None if unknown."""
+    obtained_at = credentials.get('obtained_at')
+    expires_in = credentials.get('expires_in')
+    if obtained_at and expires_in:
+        return obtained_at + expires_in - time.time()
     
-    missing_config = []
+    # Database rows store an absolute expiry instead
+    expires_at = credentials.get('expires_at')
+    if isinstance(expires_at, datetime):
+        return (expires_at - datetime.now()).total_seconds()
+    
+    return None
+
+
+def refresh_saved_credentials():
+    """
+    Reuse saved credentials, refreshing the access token if it is about to
+    expire or X rejects it.
     
-    if not X_CLIENT_ID:
-        missing_config.append("X_CLIENT_ID")
+    Returns:
+        bool: True if saved credentials are usable without logging in again
+    """
+    from app.auth.x_auth import get_user_info, load_x_credentials, refresh_access_token, save_x_credentials
     
-    if not X_CLIENT_SECRET:
-        missing_config.append("X_CLIENT_SECRET")
+    credentials = load_x_credentials()
+    if not credentials:
+        return False
     
-    if not X_REDIRECT_URI:
-        missing_config.append("X_REDIRECT_URI")
+    remaining = _seconds_remaining(credentials)
+    if remaining is not None and remaining > REFRESH_MARGIN:
+        # Not expired locally, but the token may have been revoked on X's side
+        try:
+            get_user_info(credentials['access_token'])
+            print(f"✅ Saved X credentials for @{credentials.get('username', 'unknown')} are still valid")
+            print()
+            return True
+        except Exception as e:
+            print(f"⚠️  Saved access token was rejected: {str(e)}")
     
-    if missing_config:
-        print("❌ Missing required configuration:")
-        for config in missing_config:
-            print(f"   - {config}")
-        print()
-        print("Please add these to your .env file:")
-        print("X_CLIENT_ID=your_client_id")
-        print("X_CLIENT_SECRET=your_client_secret")
-        print("X_REDIRECT_URI=http://localhost:8080/callback")
-        print()
-        print("Get these from: https://developer.x.com/")
+    refresh_token = credentials.get('refresh_token')
+    if not refresh_token:
         return False
     
-    print("✅ Configuration looks good!")
-    print(f"   Client ID: {X_CLIENT_ID[:10]}...")
-    print(f"   Redirect URI: {X_REDIRECT_URI}")
+    print("🔄 Saved access token is expiring, refreshing...")
+    try:
+        new_tokens = refresh_access_token(refresh_token)
+        credentials.update(new_tokens)
+        credentials['obtained_at'] = time.time()
+        save_x_credentials(credentials)
+    except Exception as e:
+        print(f"⚠️  Could not refresh saved token: {str(e)}")
+        return False
+    
+    print("✅ Access token refreshed!")
     print()
     return True
 
 
-def get_authorization_code():
-    """Handle the OAuth 2.0 authorization flow."""
-    print("🔐 Starting OAuth 2.0 authorization flow...")
+def build_auth_url():
+    """Generate the authorization URL, keeping the PKCE state for the callback."""
+    from app.auth.x_auth import generate_x_auth_url
     
-    try:
-        # Generate authorization URL with PKCE
-        auth_url, state, code_verifier = generate_x_auth_url()
-        
-        print("📋 Authorization URL generated with PKCE security")
-        print(f"   State: {state[:20]}...")
-        print(f"   Code verifier: {code_verifier[:20]}...")
-        print()
-        
-        # Open browser for authorization
-        print("🌐 Opening browser for authorization...")
-        print("   If browser doesn't open, copy this URL:")
-        print(f"   {auth_url}")
-        print()
-        
-        webbrowser.open(auth_url)
-        
-        # Get callback URL from user
-        print("📥 After authorizing, you'll be redirected to your callback URL.")
-        print("   Copy the FULL URL from your browser and paste it here.")
-        print()
-        
-        callback_url = input("Paste the callback URL here: ").strip()
-        
-        if not callback_url:
-            raise ValueError("No callback URL provided")
-        
-        # Parse callback URL
-        parsed_url = urlparse(callback_url)
-        query_params = parse_qs(parsed_url.query)
-        
-        # Extract authorization code and state
-        if 'code' not in query_params:
-            if 'error' in query_params:
-                error = query_params['error'][0]
-                error_description = query_params.get('error_description', ['Unknown error'])[0]
-                raise ValueError(f"Authorization failed: {error} - {error_description}")
-            else:
-                raise ValueError("No authorization code found in callback URL")
-        
-        authorization_code = query_params['code'][0]
-        returned_state = query_params.get('state', [None])[0]
-        
-        # Validate state parameter
-        if returned_state != state:
-            raise ValueError("State parameter mismatch - possible CSRF attack")
-        
-        print("✅ Authorization code received successfully!")
-        print(f"   Code: {authorization_code[:20]}...")
-        print()
-        
-        return authorization_code, code_verifier
-        
-    except Exception as e:
-        print(f"❌ Authorization failed: {str(e)}")
-        return None, None
+    auth_url, state, code_verifier = generate_x_auth_url()
+    
+    print("📋 Authorization URL generated with PKCE security")
+    print(f"   State: {state[:20]}...")
+    print(f"   Code verifier: {code_verifier[:20]}...")
+    
+    return auth_url, {'state': state, 'code_verifier': code_verifier}
 
 
-def exchange_tokens(authorization_code, code_verifier):
+def parse_callback(callback_url, flow):
+    """Extract the authorization code from the callback URL."""
+    params = extract_callback_params(callback_url, ('code', 'state', 'error', 'error_description'))
+    
+    # Extract authorization code and state
+    if 'code' not in params:
+        if 'error' in params:
+            error_description = params.get('error_description', 'Unknown error')
+            raise ValueError(f"Authorization failed: {params['error']} - {error_description}")
+        else:
+            raise ValueError("No authorization code found in callback URL")
+    
+    authorization_code = params['code']
+    
+    # Validate state parameter
+    if params.get('state') != flow['state']:
+        raise ValueError("State parameter mismatch - possible CSRF attack")
+    
+    print("✅ Authorization code received successfully!")
+    print(f"   Code: {authorization_code[:20]}...")
+    print()
+    
+    return authorization_code
+
+
+def exchange_tokens(authorization_code, flow):
     """Exchange authorization code for access tokens."""
+    from app.auth.x_auth import exchange_code_for_tokens
+    
     print("🔄 Exchanging authorization code for tokens...")
     
     try:
         # Exchange code for tokens
-        token_response = exchange_code_for_tokens(authorization_code, code_verifier)
+        token_response = exchange_code_for_tokens(authorization_code, flow['code_verifier'])
         
         print("✅ Token exchange successful!")
         print(f"   Access token: {token_response['access_token'][:20]}...")
@@ -176,12 +176,14 @@ def exchange_tokens(authorization_code, code_verifier):
         return None
 
 
-def get_account_info(access_token):
+def get_account_info(token_response):
     """Get and display account information."""
+    from app.auth.x_auth import get_user_info
+    
     print("👤 Getting account information...")
     
     try:
-        user_info = get_user_info(access_token)
+        user_info = get_user_info(token_response['access_token'])
         
         print("✅ Account information retrieved!")
         print(f"   User ID: {user_info['id']}")
@@ -210,6 +212,8 @@ def get_account_info(access_token):
 
 def save_credentials(token_response, user_info):
     """Save credentials to storage."""
+    from app.auth.x_auth import save_x_credentials
+    
     print("💾 Saving credentials...")
     
     try:
@@ -218,6 +222,7 @@ def save_credentials(token_response, user_info):
             'access_token': token_response['access_token'],
             'token_type': token_response.get('token_type', 'bearer'),
             'expires_in': token_response.get('expires_in'),
+            'obtained_at': time.time(),
             'scope': token_response.get('scope'),
             'user_id': user_info['id'],
             'username': user_info['username'],
@@ -242,28 +247,35 @@ def save_credentials(token_response, user_info):
         return False
 
 
-def test_connection():
-    """Test the X API connection."""
-    print("🧪 Testing X API connection...")
+def verify_saved_credentials(user_info):
+    """
+    Check the saved credentials load back for the account just authorised.
+    
+    The access token was validated by get_account_info moments ago, so this
+    reuses that user_info instead of calling the X API again.
+    """
+    from app.auth.x_auth import load_x_credentials
+    
+    print("🔍 Verifying saved credentials...")
     
     try:
-        connection_test = test_x_connection()
+        credentials = load_x_credentials()
         
-        if connection_test['success']:
-            print("✅ Connection test successful!")
-            print(f"   Connected as: @{connection_test['username']}")
-            print(f"   User ID: {connection_test['user_id']}")
-            print(f"   Display Name: {connection_test['name']}")
+        if credentials and str(credentials.get('user_id')) == str(user_info['id']):
+            print("✅ Saved credentials verified!")
+            print(f"   Account: @{user_info['username']}")
+            print(f"   User ID: {user_info['id']}")
+            print(f"   Display Name: {user_info['name']}")
         else:
-            print("❌ Connection test failed!")
-            print(f"   Error: {connection_test['error']}")
+            print("❌ Saved credentials could not be verified!")
+            print("   Error: Saved credentials did not load back for this account")
             return False
         
         print()
         return True
         
     except Exception as e:
-        print(f"❌ Connection test error: {str(e)}")
+        print(f"❌ Credential verification error: {str(e)}")
         return False
 
 
@@ -292,39 +304,32 @@ def show_next_steps():
     print()
 
 
+X_SPEC = ProviderSpec(
+    name="X",
+    required_env=("X_CLIENT_ID", "X_CLIENT_SECRET", "X_REDIRECT_URI"),
+    env_help="""Please add these to your .env file:
+X_CLIENT_ID=your_client_id
+X_CLIENT_SECRET=your_client_secret
+X_REDIRECT_URI=http://localhost:8080/callback
+
+Get these from: https://developer.x.com/""",
+    redirect_env="X_REDIRECT_URI",
+    build_auth_url=build_auth_url,
+    parse_callback=parse_callback,
+    exchange=exchange_tokens,
+    userinfo=get_account_info,
+    save=save_credentials,
+    test=verify_saved_credentials,
+    reuse_saved=refresh_saved_credentials
+)
+
+
 def main():
     """Main setup function."""
     print_header()
     
-    # Check configuration
-    if not check_configuration():
-        return
-    
-    # Get authorization
-    authorization_code, code_verifier = get_authorization_code()
-    if not authorization_code:
-        return
-    
-    # Exchange for tokens
-    token_response = exchange_tokens(authorization_code, code_verifier)
-    if not token_response:
-        return
-    
-    # Get account info
-    user_info = get_account_info(token_response['access_token'])
-    if not user_info:
-        return
-    
-    # Save credentials
-    if not save_credentials(token_response, user_info):
-        return
-    
-    # Test connection
-    if not test_connection():
-        return
-    
-    # Show next steps
-    show_next_steps()
+    if run_oauth_setup(X_SPEC):
+        show_next_steps()
 
 
 if __name__ == "__main__":